@@ -21,6 +21,7 @@ versions through the use of the typing_extensions library.
 """
 
 from typesense.api_call import ApiCall
+from typesense.paths import ALIASES
 from typesense.types.alias import AliasSchema
 
 
@@ -79,6 +80,4 @@ class Alias(object):
         Returns:
             str: The constructed endpoint path.
         """
-        from typesense.aliases import Aliases
-
-        return "/".join([Aliases.resource_path, self.name])
+        return "/".join([ALIASES, self.name])
@@ -29,6 +29,7 @@ import sys
 
 from typesense.alias import Alias
 from typesense.api_call import ApiCall
+from typesense.paths import ALIASES
 from typesense.types.alias import AliasCreateSchema, AliasesResponseSchema, AliasSchema
 
 if sys.version_info >= (3, 11):
@@ -50,7 +51,7 @@ class Aliases:
         aliases (Dict[str, Alias]): A dictionary of Alias objects.
     """
 
-    resource_path: typing.Final[str] = "/aliases"
+    resource_path: typing.Final[str] = ALIASES
 
     def __init__(self, api_call: ApiCall):
         """
@@ -72,9 +73,10 @@ class Aliases:
         Returns:
             Alias: The Alias object for the given name.
         """
-        if not self.aliases.get(name):
-            self.aliases[name] = Alias(self.api_call, name)
-        return self.aliases.get(name)
+        alias = self.aliases.get(name)
+        if alias is None:
+            alias = self.aliases[name] = Alias(self.api_call, name)
+        return alias
 
     def upsert(self, name: str, mapping: AliasCreateSchema) -> AliasSchema:
         """
@@ -28,6 +28,7 @@ else:
     import typing_extensions as typing
 
 from typesense.api_call import ApiCall
+from typesense.paths import ANALYTICS_RULES
 from typesense.types.analytics_rule import (
     RuleDeleteSchema,
     RuleSchemaForCounters,
@@ -99,6 +100,4 @@ class AnalyticsRule:
         Returns:
             str: The constructed endpoint path.
         """
-        from typesense.analytics_rules import AnalyticsRules
-
-        return "/".join([AnalyticsRules.resource_path, self.rule_id])
+        return "/".join([ANALYTICS_RULES, self.rule_id])
@@ -34,6 +34,7 @@ else:
 
 from typesense.analytics_rule import AnalyticsRule
 from typesense.api_call import ApiCall
+from typesense.paths import ANALYTICS_RULES
 from typesense.types.analytics_rule import (
     RuleCreateSchemaForCounters,
     RuleCreateSchemaForQueries,
@@ -61,7 +62,7 @@ class AnalyticsRules(object):
         rules (Dict[str, AnalyticsRule]): A dictionary of AnalyticsRule objects.
     """
 
-    resource_path: typing.Final[str] = "/analytics/rules"
+    resource_path: typing.Final[str] = ANALYTICS_RULES
 
     def __init__(self, api_call: ApiCall):
         """
@@ -83,9 +84,10 @@ class AnalyticsRules(object):
         Returns:
             AnalyticsRule: The AnalyticsRule object for the given ID.
         """
-        if not self.rules.get(rule_id):
-            self.rules[rule_id] = AnalyticsRule(self.api_call, rule_id)
-        return self.rules[rule_id]
+        rule = self.rules.get(rule_id)
+        if rule is None:
+            rule = self.rules[rule_id] = AnalyticsRule(self.api_call, rule_id)
+        return rule
 
     def create(
         self,
@@ -6,7 +6,8 @@ to the Typesense API, handling retries, and managing node health.
 
 Key features:
 - Support for GET, POST, PUT, PATCH, and DELETE HTTP methods
-- Automatic retries on server errors
+- Streaming of line-delimited responses
+- Automatic retries on server errors, with exponential backoff and jitter
 - Node health management
 - Type-safe request execution with overloaded methods
 
@@ -18,7 +19,8 @@ Dependencies:
     - typesense.configuration: Provides Configuration and Node classes
     - typesense.exceptions: Custom exception classes
     - typesense.node_manager: Provides NodeManager class
-    - typesense.request_handler: Provides RequestHandler class
+    - typesense.request_handler: Provides RequestHandler class and the shared
+      session, which is re-exported here as `typesense.api_call.session`
 
 Usage:
     from typesense.configuration import Configuration
@@ -32,7 +34,9 @@ Note: This module is part of the Typesense Python client library and is used int
 by other components of the library.
 """
 
+import random
 import sys
+import time
 
 import requests
 
@@ -45,13 +49,13 @@ from typesense.exceptions import (
 )
 from typesense.node_manager import NodeManager
 from typesense.request_handler import RequestHandler, SessionFunctionKwargs
+from typesense.request_handler import session as session  # noqa: F401, WPS113
 
 if sys.version_info >= (3, 11):
     import typing
 else:
     import typing_extensions as typing
 
-session = requests.sessions.Session()
 TParams = typing.TypeVar("TParams")
 TBody = typing.TypeVar("TBody")
 TEntityDict = typing.TypeVar("TEntityDict")
@@ -79,6 +83,88 @@ _SERVER_ERRORS: typing.Final[
     ServiceUnavailable,
 )
 
+# Read streamed bodies in large chunks: requests' default of 512 bytes means
+# thousands of reads, and as many Python-level loop iterations, per megabyte.
+_STREAM_CHUNK_SIZE: typing.Final[int] = 64 * 1024
+
+
+class ResponseLines:
+    """
+    Iterator over the lines of a streamed response.
+
+    The response is closed, and its connection returned to the pool, as soon as it
+    is fully read or fails. An iteration that is abandoned, or never started, must
+    be closed explicitly, either with `close` or by using the object as a context
+    manager; it is otherwise only closed when garbage collected.
+
+    Example:
+        >>> with documents.export_lines() as lines:
+        ...     first_line = next(lines)
+    """
+
+    __slots__ = ("_response", "_lines", "_closed")
+
+    def __init__(self, response: requests.Response) -> None:
+        """
+        Initialize the ResponseLines over a streamed response.
+
+        Args:
+            response (requests.Response): The streamed response.
+        """
+        # Typesense always answers in UTF-8, whatever the content type declares
+        response.encoding = "utf-8"
+        self._response = response
+        self._closed = False
+        self._lines: typing.Iterator[str] = response.iter_lines(
+            chunk_size=_STREAM_CHUNK_SIZE,
+            decode_unicode=True,
+        )
+
+    def __iter__(self) -> "ResponseLines":
+        """
+        Return the iterator itself.
+
+        Returns:
+            ResponseLines: The iterator itself.
+        """
+        return self
+
+    def __next__(self) -> str:
+        """
+        Return the next line of the response, closing it after the last one.
+
+        Returns:
+            str: The next line of the response.
+        """
+        try:
+            return next(self._lines)
+        except BaseException:
+            self.close()
+            raise
+
+    def __enter__(self) -> "ResponseLines":
+        """
+        Enter the runtime context of the ResponseLines.
+
+        Returns:
+            ResponseLines: The iterator itself.
+        """
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Close the response when leaving the runtime context."""
+        self.close()
+
+    def __del__(self) -> None:
+        """Close the response if it was never closed explicitly."""
+        self.close()
+
+    def close(self) -> None:
+        """Close the response and release its connection; closing twice is a no-op."""
+        if not self._closed:
+            self._closed = True
+            self._response.close()
+
 
 class ApiCall:
     """
@@ -93,6 +179,8 @@ class ApiCall:
         request_handler (RequestHandler): Handles the execution of individual requests.
     """
 
+    __slots__ = ("config", "node_manager", "request_handler")
+
     def __init__(self, config: Configuration):
         """
         Initialize the ApiCall instance.
@@ -166,7 +254,7 @@ class ApiCall:
             Union[TEntityDict, str]: The response, either as a JSON object or a string.
         """
         return self._execute_request(
-            session.get,
+            "GET",
             endpoint,
             entity_type,
             as_json,
@@ -238,12 +326,12 @@ class ApiCall:
             Union[TEntityDict, str]: The response, either as a JSON object or a string.
         """
         return self._execute_request(
-            session.post,
+            "POST",
             endpoint,
             entity_type,
             as_json,
             params=params,
-            data=body,
+            data=self.request_handler.serialize_body(body),
         )
 
     def put(
@@ -265,12 +353,12 @@ class ApiCall:
             EntityDict: The response, as a JSON object.
         """
         return self._execute_request(
-            session.put,
+            "PUT",
             endpoint,
             entity_type,
             as_json=True,
             params=params,
-            data=body,
+            data=self.request_handler.serialize_body(body),
         )
 
     def patch(
@@ -292,12 +380,12 @@ class ApiCall:
             EntityDict: The response, as a JSON object.
         """
         return self._execute_request(
-            session.patch,
+            "PATCH",
             endpoint,
             entity_type,
             as_json=True,
             params=params,
-            data=body,
+            data=self.request_handler.serialize_body(body),
         )
 
     def delete(
@@ -318,22 +406,45 @@ class ApiCall:
             EntityDict: The response, as a JSON object.
         """
         return self._execute_request(
-            session.delete,
+            "DELETE",
             endpoint,
             entity_type,
             as_json=True,
             params=params,
         )
 
+    def get_lines(
+        self,
+        endpoint: str,
+        params: typing.Union[TParams, None] = None,
+    ) -> ResponseLines:
+        """
+        Execute a GET request to the Typesense API and iterate over the response lines.
+
+        The body is streamed: lines are yielded as they are received, without ever
+        holding the whole response in memory. The request itself is sent right away,
+        so errors are raised by this call rather than during the iteration.
+
+        Args:
+            endpoint (str): The API endpoint to call.
+            params (Union[TParams, None], optional): Query parameters for the request.
+
+        Returns:
+            ResponseLines: The lines of the response. Close it, or use it as a
+                context manager, if it may not be read to the end.
+        """
+        return ResponseLines(self._execute_stream_request(endpoint, params=params))
+
     @typing.overload
     def _execute_request(
         self,
-        fn: typing.Callable[..., requests.models.Response],
+        method: str,
         endpoint: str,
         entity_type: typing.Type[TEntityDict],
         as_json: typing.Literal[True],
         last_exception: typing.Union[None, Exception] = None,
         num_retries: int = 0,
+        last_node: typing.Union[Node, None] = None,
         **kwargs: typing.Unpack[SessionFunctionKwargs[TParams, TBody]],
     ) -> TEntityDict:
         """
@@ -343,7 +454,7 @@ class ApiCall:
         node selection, error handling, and retries.
 
         Args:
-            fn (Callable): The HTTP method function to use (e.g., session.get).
+            method (str): The HTTP method to use (e.g., "GET").
 
             endpoint (str): The API endpoint to call.
 
@@ -355,6 +466,8 @@ class ApiCall:
 
             num_retries (int): The current number of retries attempted.
 
+            last_node (Union[Node, None], optional): The node of the failed attempt.
+
             kwargs: Additional keyword arguments for the request.
 
         Returns:
@@ -367,12 +480,13 @@ class ApiCall:
     @typing.overload
     def _execute_request(
         self,
-        fn: typing.Callable[..., requests.models.Response],
+        method: str,
         endpoint: str,
         entity_type: typing.Type[TEntityDict],
         as_json: typing.Literal[False],
         last_exception: typing.Union[None, Exception] = None,
         num_retries: int = 0,
+        last_node: typing.Union[Node, None] = None,
         **kwargs: typing.Unpack[SessionFunctionKwargs[TParams, TBody]],
     ) -> str:
         """
@@ -382,7 +496,7 @@ class ApiCall:
         node selection, error handling, and retries.
 
         Args:
-            fn (Callable): The HTTP method function to use (e.g., session.get).
+            method (str): The HTTP method to use (e.g., "GET").
 
             endpoint (str): The API endpoint to call.
 
@@ -394,6 +508,8 @@ class ApiCall:
 
             num_retries (int): The current number of retries attempted.
 
+            last_node (Union[Node, None], optional): The node of the failed attempt.
+
             kwargs: Additional keyword arguments for the request.
 
         Returns:
@@ -405,12 +521,13 @@ class ApiCall:
 
     def _execute_request(
         self,
-        fn: typing.Callable[..., requests.models.Response],
+        method: str,
         endpoint: str,
         entity_type: typing.Type[TEntityDict],
         as_json: typing.Union[typing.Literal[True], typing.Literal[False]] = True,
         last_exception: typing.Union[None, Exception] = None,
         num_retries: int = 0,
+        last_node: typing.Union[Node, None] = None,
         **kwargs: typing.Unpack[SessionFunctionKwargs[TParams, TBody]],
     ) -> typing.Union[TEntityDict, str]:
         """
@@ -420,7 +537,7 @@ class ApiCall:
         node selection, error handling, and retries.
 
         Args:
-            fn (Callable): The HTTP method function to use (e.g., session.get).
+            method (str): The HTTP method to use (e.g., "GET").
 
             endpoint (str): The API endpoint to call.
 
@@ -432,6 +549,8 @@ class ApiCall:
 
             num_retries (int): The current number of retries attempted.
 
+            last_node (Union[Node, None], optional): The node of the failed attempt.
+
             kwargs: Additional keyword arguments for the request.
 
         Returns:
@@ -440,16 +559,17 @@ class ApiCall:
         Raises:
             TypesenseClientError: If all nodes are unhealthy or max retries are exceeded.
         """
-        if num_retries > self.config.num_retries:
-            if last_exception:
-                raise last_exception
-            raise TypesenseClientError("All nodes are unhealthy")
-
-        node, url, kwargs = self._prepare_request_params(endpoint, **kwargs)
+        node, url, kwargs = self._start_attempt(
+            endpoint,
+            last_exception,
+            num_retries,
+            last_node,
+            **kwargs,
+        )
 
         try:
             return self._make_request_and_process_response(
-                fn,
+                method,
                 url,
                 entity_type,
                 as_json,
@@ -458,18 +578,135 @@ class ApiCall:
         except _SERVER_ERRORS as server_error:
             self.node_manager.set_node_health(node, is_healthy=False)
             return self._execute_request(
-                fn,
+                method,
                 endpoint,
                 entity_type,
                 as_json,
                 last_exception=server_error,
                 num_retries=num_retries + 1,
+                last_node=node,
+                **kwargs,
+            )
+
+    def _execute_stream_request(
+        self,
+        endpoint: str,
+        last_exception: typing.Union[None, Exception] = None,
+        num_retries: int = 0,
+        last_node: typing.Union[Node, None] = None,
+        **kwargs: typing.Unpack[SessionFunctionKwargs[TParams, TBody]],
+    ) -> requests.Response:
+        """
+        Execute a streamed GET request to the Typesense API with retry logic.
+
+        Only sending the request and reading its status are retried; the body is
+        left unread for the caller.
+
+        Args:
+            endpoint (str): The API endpoint to call.
+
+            last_exception (Union[None, Exception], optional): The last exception encountered.
+
+            num_retries (int): The current number of retries attempted.
+
+            last_node (Union[Node, None], optional): The node of the failed attempt.
+
+            kwargs: Additional keyword arguments for the request.
+
+        Returns:
+            requests.Response: The response, with its body unread.
+
+        Raises:
+            TypesenseClientError: If all nodes are unhealthy or max retries are exceeded.
+        """
+        node, url, kwargs = self._start_attempt(
+            endpoint,
+            last_exception,
+            num_retries,
+            last_node,
+            **kwargs,
+        )
+
+        try:
+            response = self.request_handler.make_stream_request("GET", url, **kwargs)
+        except _SERVER_ERRORS as server_error:
+            self.node_manager.set_node_health(node, is_healthy=False)
+            return self._execute_stream_request(
+                endpoint,
+                last_exception=server_error,
+                num_retries=num_retries + 1,
+                last_node=node,
                 **kwargs,
             )
+        self.node_manager.set_node_health(node, is_healthy=True)
+        return response
+
+    def _start_attempt(
+        self,
+        endpoint: str,
+        last_exception: typing.Union[None, Exception],
+        num_retries: int,
+        last_node: typing.Union[Node, None],
+        **kwargs: typing.Unpack[SessionFunctionKwargs[TParams, TBody]],
+    ) -> typing.Tuple[Node, str, SessionFunctionKwargs[TParams, TBody]]:
+        """
+        Pick the node for the next attempt, waiting first if it is the one that failed.
+
+        Args:
+            endpoint (str): The API endpoint to call.
+
+            last_exception (Union[None, Exception]): The last exception encountered.
+
+            num_retries (int): The current number of retries attempted.
+
+            last_node (Union[Node, None]): The node of the failed attempt.
+
+            kwargs: Additional keyword arguments for the request.
+
+        Returns:
+            Tuple[Node, str, SessionFunctionKwargs]: The node, the URL and the
+                request arguments.
+
+        Raises:
+            TypesenseClientError: If all nodes are unhealthy or max retries are exceeded.
+        """
+        if num_retries > self.config.num_retries:
+            if last_exception:
+                raise last_exception
+            raise TypesenseClientError("All nodes are unhealthy")
+
+        node, url, kwargs = self._prepare_request_params(endpoint, **kwargs)
+        if node is last_node:
+            # Failing over to another node is immediate; only a retry against the
+            # node that just failed waits for it to recover.
+            time.sleep(self._retry_delay(num_retries - 1))
+        return node, url, kwargs
+
+    def _retry_delay(self, num_retries: int) -> float:
+        """
+        Compute how long to wait before the next retry.
+
+        The delay grows exponentially from `retry_interval_seconds`, is randomly
+        spread by `retry_jitter`, and is kept between 0 and
+        `retry_max_interval_seconds`.
+
+        Args:
+            num_retries (int): The number of retries attempted so far.
+
+        Returns:
+            float: The delay in seconds.
+        """
+        backoff: float = (
+            self.config.retry_interval_seconds
+            * self.config.retry_backoff_multiplier**num_retries
+        )
+        jitter = random.uniform(-self.config.retry_jitter, self.config.retry_jitter)
+        delay = min(self.config.retry_max_interval_seconds, backoff * (1 + jitter))
+        return max(0.0, delay)
 
     def _make_request_and_process_response(
         self,
-        fn: typing.Callable[..., requests.models.Response],
+        method: str,
         url: str,
         entity_type: typing.Type[TEntityDict],
         as_json: bool,
@@ -477,7 +714,7 @@ class ApiCall:
     ) -> typing.Union[TEntityDict, str]:
         """Make the API request and process the response."""
         request_response = self.request_handler.make_request(
-            fn=fn,
+            method=method,
             url=url,
             as_json=as_json,
             entity_type=entity_type,
@@ -496,7 +733,7 @@ class ApiCall:
         **kwargs: typing.Unpack[SessionFunctionKwargs[TParams, TBody]],
     ) -> typing.Tuple[Node, str, SessionFunctionKwargs[TParams, TBody]]:
         node = self.node_manager.get_node()
-        url = node.url() + endpoint
+        url = self.node_manager.base_url(node) + endpoint
 
         if kwargs.get("params"):
             self.request_handler.normalize_params(kwargs["params"])
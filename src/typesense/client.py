@@ -101,6 +101,28 @@ class Client:
         self.stopwords = Stopwords(self.api_call)
         self.conversations_models = ConversationsModels(self.api_call)
 
+    def __enter__(self) -> "Client":
+        """
+        Enter the runtime context of the Client.
+
+        Returns:
+            Client: The Client itself.
+        """
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Close the Client when leaving the runtime context."""
+        self.close()
+
+    def close(self) -> None:
+        """
+        Release the resources held by the Client.
+
+        This stops the background health checker started by the
+        `background_healthcheck` option; the Client can still make requests after.
+        """
+        self.api_call.node_manager.close()
+
     def typed_collection(
         self,
         *,
@@ -20,6 +20,7 @@ Note: This module uses conditional imports to support both Python 3.11+ and earl
 
 import sys
 
+from typesense.paths import COLLECTIONS
 from typesense.types.collection import CollectionSchema, CollectionUpdateSchema
 
 if sys.version_info >= (3, 11):
@@ -66,6 +67,27 @@ class Collection(typing.Generic[TDoc]):
         self.overrides = Overrides(api_call, name)
         self.synonyms = Synonyms(api_call, name)
 
+    @property
+    def name(self) -> str:
+        """
+        Get the name of the collection.
+
+        Returns:
+            str: The name of the collection.
+        """
+        return self._name
+
+    @name.setter
+    def name(self, name: str) -> None:
+        """
+        Set the name of the collection and rebuild its endpoint path.
+
+        Args:
+            name (str): The name of the collection.
+        """
+        self._name = name
+        self._endpoint_path = "/".join([COLLECTIONS, name])
+
     def retrieve(self) -> CollectionSchema:
         """
         Retrieve the schema of this collection from Typesense.
@@ -121,15 +143,3 @@ class Collection(typing.Generic[TDoc]):
             params=delete_parameters,
         )
         return response
-
-    @property
-    def _endpoint_path(self) -> str:
-        """
-        Get the API endpoint path for this collection.
-
-        Returns:
-            str: The full endpoint path for the collection.
-        """
-        from typesense.collections import Collections
-
-        return "/".join([Collections.resource_path, self.name])
@@ -25,6 +25,7 @@ else:
 
 from typesense.api_call import ApiCall
 from typesense.collection import Collection
+from typesense.paths import COLLECTIONS
 from typesense.types.collection import CollectionCreateSchema, CollectionSchema
 from typesense.types.document import DocumentSchema
 
@@ -45,7 +46,7 @@ class Collections(typing.Generic[TDoc]):
            A dictionary of Collection instances, keyed by collection name.
     """
 
-    resource_path: typing.Final[str] = "/collections"
+    resource_path: typing.Final[str] = COLLECTIONS
 
     def __init__(self, api_call: ApiCall):
         """
@@ -74,12 +75,13 @@ class Collections(typing.Generic[TDoc]):
             >>> collections = Collections(api_call)
             >>> fruits_collection = collections['fruits']
         """
-        if not self.collections.get(collection_name):
-            self.collections[collection_name] = Collection(
+        collection = self.collections.get(collection_name)
+        if collection is None:
+            collection = self.collections[collection_name] = Collection(
                 self.api_call,
                 collection_name,
             )
-        return self.collections[collection_name]
+        return collection
 
     def create(self, schema: CollectionCreateSchema) -> CollectionSchema:
         """
@@ -64,9 +64,26 @@ class ConfigDict(typing.TypedDict):
 
         interval_seconds (int): The interval in seconds between retries.
 
+        retry_interval_seconds (float): The delay in seconds before the first retry
+            against a node that just failed; failing over to another node is
+            immediate.
+
+        retry_backoff_multiplier (float): The factor by which the retry delay grows
+            after each retry.
+
+        retry_max_interval_seconds (float): The upper bound, in seconds, for the
+            retry delay.
+
+        retry_jitter (float): The fraction, between 0 and 1, of the retry delay
+            that is randomly added or subtracted, so that clients do not retry in
+            lockstep.
+
         healthcheck_interval_seconds (int): The interval in seconds between
             health checks.
 
+        background_healthcheck (bool): Whether to probe every node's health endpoint
+            from a background thread, once per health check interval.
+
         verify (bool): Whether to verify the SSL certificate.
 
         timeout_seconds (int, deprecated): The connection timeout in seconds.
@@ -83,7 +100,12 @@ class ConfigDict(typing.TypedDict):
     api_key: str
     num_retries: typing.NotRequired[int]
     interval_seconds: typing.NotRequired[int]
+    retry_interval_seconds: typing.NotRequired[float]
+    retry_backoff_multiplier: typing.NotRequired[float]
+    retry_max_interval_seconds: typing.NotRequired[float]
+    retry_jitter: typing.NotRequired[float]
     healthcheck_interval_seconds: typing.NotRequired[int]
+    background_healthcheck: typing.NotRequired[bool]
     verify: typing.NotRequired[bool]
     timeout_seconds: typing.NotRequired[int]  # deprecated
     master_node: typing.NotRequired[typing.Union[str, NodeConfigDict]]  # deprecated
@@ -128,8 +150,9 @@ class Node:
         # Used to skip bad hosts
         self.healthy = True
 
-        # Used to track the last time this node was accessed
-        self.last_access_ts: int = int(time.time())
+        # Used to track the last time this node was accessed, on the monotonic clock
+        # so that wall-clock adjustments cannot delay or trigger health checks
+        self.last_access_ts: int = int(time.monotonic())
 
     @classmethod
     def from_url(cls, url: str) -> "Node":
@@ -175,8 +198,12 @@ class Configuration:
         api_key (str): The API key to use for authentication.
         connection_timeout_seconds (float): The connection timeout in seconds.
         num_retries (int): The number of retries to attempt before failing.
-        retry_interval_seconds (float): The interval in seconds between retries.
+        retry_interval_seconds (float): The delay before retrying the same node.
+        retry_backoff_multiplier (float): The growth factor of the retry delay.
+        retry_max_interval_seconds (float): The upper bound for the retry delay.
+        retry_jitter (float): The random fraction added to or removed from the delay.
         healthcheck_interval_seconds (int): The interval in seconds between health checks.
+        background_healthcheck (bool): Whether to probe node health in the background.
         verify (bool): Whether to verify the SSL certificate.
     """
 
@@ -208,10 +235,20 @@ class Configuration:
         )
         self.num_retries = config_dict.get("num_retries", 3)
         self.retry_interval_seconds = config_dict.get("retry_interval_seconds", 1.0)
+        self.retry_backoff_multiplier = config_dict.get(
+            "retry_backoff_multiplier",
+            2.0,
+        )
+        self.retry_max_interval_seconds = config_dict.get(
+            "retry_max_interval_seconds",
+            10.0,
+        )
+        self.retry_jitter = config_dict.get("retry_jitter", 0.2)
         self.healthcheck_interval_seconds = config_dict.get(
             "healthcheck_interval_seconds",
             60,
         )
+        self.background_healthcheck = config_dict.get("background_healthcheck", False)
         self.verify = config_dict.get("verify", True)
 
     def _handle_nearest_node(
@@ -258,6 +295,10 @@ class Configuration:
 class ConfigurationValidations:
     """Class for validating the configuration dictionary."""
 
+    required_node_fields: typing.Final[typing.FrozenSet[str]] = frozenset(
+        ("host", "port", "protocol"),
+    )
+
     @staticmethod
     def validate_config_dict(config_dict: ConfigDict) -> None:
         """
@@ -276,6 +317,8 @@ class ConfigurationValidations:
         if nearest_node:
             ConfigurationValidations.validate_nearest_node(nearest_node)
 
+        ConfigurationValidations.validate_retry_fields(config_dict)
+
     @staticmethod
     def validate_required_config_fields(config_dict: ConfigDict) -> None:
         """
@@ -338,6 +381,30 @@ class ConfigurationValidations:
                 ),
             )
 
+    @staticmethod
+    def validate_retry_fields(config_dict: ConfigDict) -> None:
+        """
+        Validate the retry delay settings in the configuration dictionary.
+
+        Args:
+            config_dict (ConfigDict): The configuration dictionary to validate.
+
+        Raises:
+            ConfigError: If a retry interval or the backoff multiplier is negative,
+                or the jitter is not between 0 and 1.
+        """
+        if config_dict.get("retry_interval_seconds", 0) < 0:
+            raise ConfigError("`retry_interval_seconds` must not be negative.")
+
+        if config_dict.get("retry_max_interval_seconds", 0) < 0:
+            raise ConfigError("`retry_max_interval_seconds` must not be negative.")
+
+        if config_dict.get("retry_backoff_multiplier", 0) < 0:
+            raise ConfigError("`retry_backoff_multiplier` must not be negative.")
+
+        if not 0 <= config_dict.get("retry_jitter", 0) <= 1:
+            raise ConfigError("`retry_jitter` must be between 0 and 1.")
+
     @staticmethod
     def validate_node_fields(node: typing.Union[str, NodeConfigDict]) -> bool:
         """
@@ -351,8 +418,7 @@ class ConfigurationValidations:
         """
         if isinstance(node, str):
             return True
-        expected_fields = {"host", "port", "protocol"}
-        return expected_fields.issubset(node)
+        return ConfigurationValidations.required_node_fields.issubset(node)
 
     @staticmethod
     def show_deprecation_warnings(config_dict: ConfigDict) -> None:
@@ -23,6 +23,7 @@ versions through the use of the typing_extensions library.
 """
 
 from typesense.api_call import ApiCall
+from typesense.paths import CONVERSATIONS_MODELS
 from typesense.types.conversations_model import (
     ConversationModelCreateSchema,
     ConversationModelDeleteSchema,
@@ -106,6 +107,4 @@ class ConversationModel:
         Returns:
             str: The constructed endpoint path.
         """
-        from typesense.conversations_models import ConversationsModels
-
-        return "/".join([ConversationsModels.resource_path, self.model_id])
+        return "/".join([CONVERSATIONS_MODELS, self.model_id])
@@ -30,6 +30,7 @@ versions through the use of the typing_extensions library.
 import sys
 
 from typesense.api_call import ApiCall
+from typesense.paths import CONVERSATIONS_MODELS
 from typesense.types.conversations_model import (
     ConversationModelCreateSchema,
     ConversationModelSchema,
@@ -57,7 +58,7 @@ class ConversationsModels(object):
             A dictionary of ConversationModel objects.
     """
 
-    resource_path: typing.Final[str] = "/conversations/models"
+    resource_path: typing.Final[str] = CONVERSATIONS_MODELS
 
     def __init__(self, api_call: ApiCall) -> None:
         """
@@ -79,12 +80,12 @@ class ConversationsModels(object):
         Returns:
             ConversationModel: The ConversationModel object for the given ID.
         """
-        if model_id not in self.conversations_models:
-            self.conversations_models[model_id] = ConversationModel(
-                self.api_call,
-                model_id,
+        conversation_model = self.conversations_models.get(model_id)
+        if conversation_model is None:
+            conversation_model = self.conversations_models[model_id] = (
+                ConversationModel(self.api_call, model_id)
             )
-        return self.conversations_models[model_id]
+        return conversation_model
 
     def create(self, model: ConversationModelCreateSchema) -> ConversationModelSchema:
         """
@@ -6,7 +6,6 @@ Classes:
 
 Methods:
     - __init__: Initializes the Document object.
-    - _endpoint_path: Constructs the API endpoint path for this specific document.
     - retrieve: Retrieves the details of this specific document.
     - update: Updates this specific document.
     - delete: Deletes this specific document.
@@ -22,6 +21,7 @@ versions through the use of the typing_extensions library.
 import sys
 
 from typesense.api_call import ApiCall
+from typesense.paths import COLLECTIONS, DOCUMENTS
 from typesense.types.document import DirtyValuesParameters, DocumentSchema
 
 if sys.version_info >= (3, 11):
@@ -60,8 +60,51 @@ class Document(typing.Generic[TDoc]):
             document_id (str): The ID of the document.
         """
         self.api_call = api_call
-        self.collection_name = collection_name
-        self.document_id = document_id
+        self._collection_name = collection_name
+        self._document_id = document_id
+        self._build_endpoint_path()
+
+    @property
+    def collection_name(self) -> str:
+        """
+        Get the name of the collection.
+
+        Returns:
+            str: The name of the collection.
+        """
+        return self._collection_name
+
+    @collection_name.setter
+    def collection_name(self, collection_name: str) -> None:
+        """
+        Set the name of the collection and rebuild the endpoint path.
+
+        Args:
+            collection_name (str): The name of the collection.
+        """
+        self._collection_name = collection_name
+        self._build_endpoint_path()
+
+    @property
+    def document_id(self) -> str:
+        """
+        Get the ID of the document.
+
+        Returns:
+            str: The ID of the document.
+        """
+        return self._document_id
+
+    @document_id.setter
+    def document_id(self, document_id: str) -> None:
+        """
+        Set the ID of the document and rebuild the endpoint path.
+
+        Args:
+            document_id (str): The ID of the document.
+        """
+        self._document_id = document_id
+        self._build_endpoint_path()
 
     def retrieve(self) -> TDoc:
         """
@@ -114,22 +157,8 @@ class Document(typing.Generic[TDoc]):
         )
         return response
 
-    @property
-    def _endpoint_path(self) -> str:
-        """
-        Construct the API endpoint path for this specific document.
-
-        Returns:
-            str: The constructed endpoint path.
-        """
-        from typesense.collections import Collections
-        from typesense.documents import Documents
-
-        return "/".join(
-            [
-                Collections.resource_path,
-                self.collection_name,
-                Documents.resource_path,
-                self.document_id,
-            ],
+    def _build_endpoint_path(self) -> None:
+        """Build the API endpoint path for this specific document."""
+        self._endpoint_path = "/".join(
+            [COLLECTIONS, self._collection_name, DOCUMENTS, self._document_id],
         )
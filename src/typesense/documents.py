@@ -15,6 +15,7 @@ Methods:
     - import_jsonl: (Deprecated) Imports documents from a JSONL string.
     - import_: Imports documents into the collection.
     - export: Exports documents from the collection.
+    - export_lines: Streams the exported documents, one line at a time.
     - search: Searches for documents in the collection.
     - delete: Deletes documents from the collection based on given parameters.
 
@@ -32,10 +33,11 @@ versions through the use of the typing_extensions library.
 import json
 import sys
 
-from typesense.api_call import ApiCall
+from typesense.api_call import ApiCall, ResponseLines
 from typesense.document import Document
 from typesense.exceptions import TypesenseClientError
 from typesense.logger import logger
+from typesense.paths import COLLECTIONS, DOCUMENTS
 from typesense.preprocess import stringify_search_params
 from typesense.types.document import (
     DeleteQueryParameters,
@@ -90,7 +92,7 @@ class Documents(typing.Generic[TDoc]):
         documents (Dict[str, Document[TDoc]]): A dictionary of Document objects.
     """
 
-    resource_path: typing.Final[str] = "documents"
+    resource_path: typing.Final[str] = DOCUMENTS
 
     def __init__(self, api_call: ApiCall, collection_name: str) -> None:
         """
@@ -101,9 +103,31 @@ class Documents(typing.Generic[TDoc]):
             collection_name (str): The name of the collection.
         """
         self.api_call = api_call
+        self._endpoint_paths: typing.Dict[str, str] = {}
         self.collection_name = collection_name
         self.documents: typing.Dict[str, Document[TDoc]] = {}
 
+    @property
+    def collection_name(self) -> str:
+        """
+        Get the name of the collection.
+
+        Returns:
+            str: The name of the collection.
+        """
+        return self._collection_name
+
+    @collection_name.setter
+    def collection_name(self, collection_name: str) -> None:
+        """
+        Set the name of the collection and drop the endpoint paths built from it.
+
+        Args:
+            collection_name (str): The name of the collection.
+        """
+        self._collection_name = collection_name
+        self._endpoint_paths.clear()
+
     def __getitem__(self, document_id: str) -> Document[TDoc]:
         """
         Get or create a Document object for a given document_id.
@@ -114,14 +138,14 @@ class Documents(typing.Generic[TDoc]):
         Returns:
             Document[TDoc]: The Document object for the given ID.
         """
-        if document_id not in self.documents:
-            self.documents[document_id] = Document(
+        document = self.documents.get(document_id)
+        if document is None:
+            document = self.documents[document_id] = Document(
                 self.api_call,
                 self.collection_name,
                 document_id,
             )
-
-        return self.documents[document_id]
+        return document
 
     def create(
         self,
@@ -301,7 +325,8 @@ class Documents(typing.Generic[TDoc]):
         It can handle both individual documents and batches of documents.
 
         Args:
-            documents: The documents to import.
+            documents: The documents to import. JSONL that is already serialized
+                can be passed as `str` or `bytes` and is sent as is.
             import_parameters: Parameters for the import operation.
             batch_size: The size of each batch for batch imports.
 
@@ -341,6 +366,29 @@ class Documents(typing.Generic[TDoc]):
         )
         return api_response
 
+    def export_lines(
+        self,
+        export_parameters: typing.Union[DocumentExportParameters, None] = None,
+    ) -> ResponseLines:
+        """
+        Export documents from the collection, one JSON document per line.
+
+        The export is streamed, so large collections can be processed as they are
+        received instead of being held in memory as a single string.
+
+        Args:
+            export_parameters (Union[DocumentExportParameters, None], optional):
+                Parameters for the export operation.
+
+        Returns:
+            ResponseLines: The exported documents, as JSON strings. Close it, or use
+                it as a context manager, if it may not be read to the end.
+        """
+        return self.api_call.get_lines(
+            self._endpoint_path("export"),
+            params=export_parameters,
+        )
+
     def search(self, search_parameters: SearchParameters) -> SearchResponse[TDoc]:
         """
         Search for documents in the collection.
@@ -385,23 +433,26 @@ class Documents(typing.Generic[TDoc]):
         """
         Construct the API endpoint path for document operations.
 
+        Paths are built once per action and then reused.
+
         Args:
             action (Union[str, None], optional): The action to perform. Defaults to None.
 
         Returns:
             str: The constructed endpoint path.
         """
-        from typesense.collections import Collections
-
         action = action or ""
-        return "/".join(
-            [
-                Collections.resource_path,
-                self.collection_name,
-                self.resource_path,
-                action,
-            ],
-        )
+        endpoint_path = self._endpoint_paths.get(action)
+        if endpoint_path is None:
+            endpoint_path = self._endpoint_paths[action] = "/".join(
+                [
+                    COLLECTIONS,
+                    self.collection_name,
+                    self.resource_path,
+                    action,
+                ],
+            )
+        return endpoint_path
 
     def _import_raw(
         self,
@@ -439,11 +490,10 @@ class Documents(typing.Generic[TDoc]):
         import_parameters: _ImportParameters,
     ) -> ImportResponse[TDoc]:
         """Import a list of documents in bulk."""
-        document_strs = [json.dumps(doc) for doc in documents]
-        if not document_strs:
+        if not documents:
             raise TypesenseClientError("Cannot import an empty list of documents.")
 
-        docs_import = "\n".join(document_strs)
+        docs_import = self.api_call.request_handler.serialize_jsonl(documents)
         res = self.api_call.post(
             self._endpoint_path("import"),
             body=docs_import,
@@ -18,6 +18,7 @@ versions through the use of the typing_extensions library.
 """
 
 from typesense.api_call import ApiCall
+from typesense.paths import KEYS
 from typesense.types.key import ApiKeyDeleteSchema, ApiKeySchema
 
 
@@ -79,6 +80,4 @@ class Key:
         Returns:
             str: The constructed endpoint path.
         """
-        from typesense.keys import Keys
-
-        return "/".join([Keys.resource_path, str(self.key_id)])
+        return "/".join([KEYS, str(self.key_id)])
@@ -23,13 +23,13 @@ versions through the use of the typing_extensions library.
 """
 
 import base64
-import hashlib
 import hmac
 import json
 import sys
 
 from typesense.api_call import ApiCall
 from typesense.key import Key
+from typesense.paths import KEYS
 from typesense.types.document import GenerateScopedSearchKeyParams
 from typesense.types.key import (
     ApiKeyCreateResponseSchema,
@@ -57,7 +57,7 @@ class Keys:
         keys (Dict[int, Key]): A dictionary of Key objects.
     """
 
-    resource_path: typing.Final[str] = "/keys"
+    resource_path: typing.Final[str] = KEYS
 
     def __init__(self, api_call: ApiCall) -> None:
         """
@@ -79,9 +79,10 @@ class Keys:
         Returns:
             Key: The Key object for the given ID.
         """
-        if not self.keys.get(key_id):
-            self.keys[key_id] = Key(self.api_call, key_id)
-        return self.keys[key_id]
+        key = self.keys.get(key_id)
+        if key is None:
+            key = self.keys[key_id] = Key(self.api_call, key_id)
+        return key
 
     def create(self, schema: ApiKeyCreateSchema) -> ApiKeyCreateResponseSchema:
         """
@@ -119,17 +120,12 @@ class Keys:
         Returns:
             bytes: The generated scoped search key.
         """
-        params_str = json.dumps(key_parameters)
+        params_bytes = json.dumps(key_parameters).encode("utf-8")
         digest = base64.b64encode(
-            hmac.new(
-                search_key.encode("utf-8"),
-                params_str.encode("utf-8"),
-                digestmod=hashlib.sha256,
-            ).digest(),
+            hmac.digest(search_key.encode("utf-8"), params_bytes, "sha256"),
         )
-        key_prefix = search_key[:4]
-        raw_scoped_key = f"{digest.decode('utf-8')}{key_prefix}{params_str}"
-        return base64.b64encode(raw_scoped_key.encode("utf-8"))
+        key_prefix = search_key[:4].encode("utf-8")
+        return base64.b64encode(digest + key_prefix + params_bytes)
 
     def retrieve(self) -> ApiKeyRetrieveSchema:
         """
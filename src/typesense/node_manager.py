@@ -9,11 +9,14 @@ Key features:
 - Nearest node prioritization (if configured)
 - Node health tracking and updates
 - Periodic health checks based on a configurable interval
+- Optional background probing of each node's health endpoint
 
 Classes:
     NodeManager: Manages the nodes in a Typesense cluster configuration.
+    HealthChecker: Background thread that probes the health of every node.
 
 Dependencies:
+    - requests: For probing the health endpoint of each node
     - typesense.configuration: Provides Configuration and Node classes
     - typesense.logger: Provides logging functionality
 
@@ -25,16 +28,29 @@ Usage:
     node_manager = NodeManager(config)
     node = node_manager.get_node()
 
+    # With `background_healthcheck`, close the manager to stop the health checker
+    with NodeManager(config) as node_manager:
+        node = node_manager.get_node()
+
 Note: This module is part of the Typesense Python client library and is
 used internally by other components of the library.
 """
 
-import copy
+import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
 
 from typesense.configuration import Configuration, Node
 from typesense.logger import logger
 
+if sys.version_info >= (3, 11):
+    import typing
+else:
+    import typing_extensions as typing
+
 
 class NodeManager:
     """
@@ -46,6 +62,7 @@ class NodeManager:
     Attributes:
         config (Configuration): The configuration object for the Typesense client.
         nodes (List[Node]): A copy of the nodes from the configuration.
+        nearest_node (Node | None): A copy of the nearest node from the configuration.
         node_index (int): The index of the current node in the rotation.
     """
 
@@ -57,9 +74,37 @@ class NodeManager:
             config (Configuration): The configuration object for the Typesense client.
         """
         self.config = config
-        self.nodes = copy.deepcopy(config.nodes)
+        # Health state is tracked per manager, so copy the nodes rather than share them
+        self.nodes = [self._copy_node(node) for node in config.nodes]
+        self.nearest_node = (
+            self._copy_node(config.nearest_node) if config.nearest_node else None
+        )
         self.node_index = 0
+        self._base_urls: typing.Dict[Node, str] = {}
         self._initialize_nodes()
+        self.health_checker: typing.Union[HealthChecker, None] = None
+        if config.background_healthcheck:
+            self.health_checker = HealthChecker(self)
+            self.health_checker.start()
+
+    def __enter__(self) -> "NodeManager":
+        """
+        Enter the runtime context of the NodeManager.
+
+        Returns:
+            NodeManager: The NodeManager itself.
+        """
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Close the NodeManager when leaving the runtime context."""
+        self.close()
+
+    def close(self) -> None:
+        """Stop the background health checker, if any, and close its session."""
+        if self.health_checker is not None:
+            self.health_checker.close()
+            self.health_checker = None
 
     def get_node(self) -> Node:
         """
@@ -71,23 +116,43 @@ class NodeManager:
         Returns:
             Node: The selected node for the next operation.
         """
-        if self.config.nearest_node:
-            if self.config.nearest_node.healthy or self._is_due_for_health_check(
-                self.config.nearest_node,
+        if self.nearest_node:
+            if self.nearest_node.healthy or self._is_due_for_health_check(
+                self.nearest_node,
             ):
-                return self.config.nearest_node
+                return self.nearest_node
 
+        # Read the clock once for the whole scan rather than once per unhealthy node
+        current_ts = int(time.monotonic())
+        num_nodes = len(self.nodes)
         node_index = 0
-        while node_index < len(self.nodes):
+        while node_index < num_nodes:
             node_index += 1
             node = self.nodes[self.node_index]
-            self.node_index = (self.node_index + 1) % len(self.nodes)
-            if node.healthy or self._is_due_for_health_check(node):
+            self.node_index += 1
+            if self.node_index == num_nodes:
+                self.node_index = 0
+            if node.healthy or self._is_due_for_health_check(node, current_ts):
                 return node
 
         logger.debug("No healthy nodes were found. Returning the next node.")
         return self.nodes[self.node_index]
 
+    def base_url(self, node: Node) -> str:
+        """
+        Get the base URL of a node, formatting it only the first time it is requested.
+
+        Args:
+            node (Node): The node to get the URL for.
+
+        Returns:
+            str: The URL of the node.
+        """
+        url = self._base_urls.get(node)
+        if url is None:
+            url = self._base_urls[node] = node.url()
+        return url
+
     def set_node_health(self, node: Node, is_healthy: bool) -> None:
         """
         Set the health status of a node and update its last access timestamp.
@@ -97,24 +162,44 @@ class NodeManager:
             is_healthy (bool): The health status to set for the node.
         """
         node.healthy = is_healthy
-        node.last_access_ts = int(time.time())
+        node.last_access_ts = int(time.monotonic())
 
-    def _is_due_for_health_check(self, node: Node) -> bool:
+    def _is_due_for_health_check(
+        self,
+        node: Node,
+        current_ts: typing.Union[int, None] = None,
+    ) -> bool:
         """
         Check if a node is due for a health check based on the configured interval.
 
         Args:
             node (Node): The node to check.
+            current_ts (int, optional): The current monotonic time, if the caller
+                already read it. Defaults to reading the clock.
 
         Returns:
             bool: True if the node is due for a health check, False otherwise.
         """
-        current_epoch_ts = int(time.time())
+        if current_ts is None:
+            current_ts = int(time.monotonic())
         return bool(
-            (current_epoch_ts - node.last_access_ts)
+            (current_ts - node.last_access_ts)
             > self.config.healthcheck_interval_seconds,
         )
 
+    @staticmethod
+    def _copy_node(node: Node) -> Node:
+        """
+        Copy a node's address, without its health state.
+
+        Args:
+            node (Node): The node to copy.
+
+        Returns:
+            Node: A new node with the same host, port, path and protocol.
+        """
+        return Node(node.host, node.port, node.path, node.protocol)
+
     def _initialize_nodes(self) -> None:
         """
         Initialize all nodes as healthy.
@@ -122,7 +207,86 @@ class NodeManager:
         This method sets the initial health status of all nodes, including the nearest node
         if configured, to healthy.
         """
-        if self.config.nearest_node:
-            self.set_node_health(self.config.nearest_node, is_healthy=True)
+        if self.nearest_node:
+            self.set_node_health(self.nearest_node, is_healthy=True)
         for node in self.nodes:
             self.set_node_health(node, is_healthy=True)
+
+
+class HealthChecker(threading.Thread):
+    """
+    Background thread that probes the health endpoint of every node.
+
+    Every `healthcheck_interval_seconds`, all nodes (including the nearest node, if
+    configured) are probed concurrently and their health is recorded on the
+    NodeManager, so that recovered nodes are picked up again without waiting for a
+    request to land on them. Probing concurrently keeps a node that hangs until the
+    connection timeout from delaying the results of the others.
+
+    Call `close` (or close the NodeManager) to stop the thread and its session.
+
+    Attributes:
+        node_manager (NodeManager): The manager whose nodes are probed.
+        session (requests.Session): The session used for the probes.
+    """
+
+    health_endpoint: typing.Final[str] = "/health"
+
+    def __init__(self, node_manager: NodeManager) -> None:
+        """
+        Initialize the HealthChecker for a NodeManager.
+
+        Args:
+            node_manager (NodeManager): The manager whose nodes are probed.
+        """
+        super().__init__(name="typesense-health-checker", daemon=True)
+        self.node_manager = node_manager
+        self.session = requests.Session()
+        self._stopped = threading.Event()
+
+    def run(self) -> None:
+        """Probe the nodes every health check interval until stopped."""
+        interval = self.node_manager.config.healthcheck_interval_seconds
+        while not self._stopped.wait(interval):
+            self.probe_nodes()
+
+    def stop(self) -> None:
+        """Stop probing after the current round."""
+        self._stopped.set()
+
+    def close(self) -> None:
+        """Stop probing, wait for the current round to finish and close the session."""
+        self.stop()
+        if self.is_alive():
+            self.join()
+        self.session.close()
+
+    def probe_nodes(self) -> None:
+        """Probe every node once and record whether it is healthy."""
+        nodes = list(self.node_manager.nodes)
+        if self.node_manager.nearest_node:
+            nodes.insert(0, self.node_manager.nearest_node)
+        with ThreadPoolExecutor(max_workers=len(nodes)) as executor:
+            for node, is_healthy in zip(nodes, executor.map(self._is_healthy, nodes)):
+                self.node_manager.set_node_health(node, is_healthy=is_healthy)
+
+    def _is_healthy(self, node: Node) -> bool:
+        """
+        Check whether a node answers its health endpoint successfully.
+
+        Args:
+            node (Node): The node to probe.
+
+        Returns:
+            bool: True if the node responded with HTTP 200, False otherwise.
+        """
+        config = self.node_manager.config
+        try:
+            response = self.session.get(
+                self.node_manager.base_url(node) + self.health_endpoint,
+                timeout=config.connection_timeout_seconds,
+                verify=config.verify,
+            )
+        except requests.exceptions.RequestException:
+            return False
+        return response.status_code == 200
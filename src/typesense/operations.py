@@ -193,10 +193,9 @@ class Operations:
             as_json=True,
             entity_type=HealthCheckResponse,
         )
-        if isinstance(call_resp, typing.Dict):
-            is_ok: bool = call_resp.get("ok", False)
-        else:
-            is_ok = False
+        if not isinstance(call_resp, dict):
+            return False
+        is_ok: bool = call_resp.get("ok", False)
         return is_ok
 
     def toggle_slow_request_log(
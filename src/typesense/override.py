@@ -22,6 +22,7 @@ versions through the use of the typing_extensions library.
 """
 
 from typesense.api_call import ApiCall
+from typesense.paths import COLLECTIONS, OVERRIDES
 from typesense.types.override import OverrideDeleteSchema, OverrideSchema
 
 
@@ -90,14 +91,11 @@ class Override:
         Returns:
             str: The constructed endpoint path.
         """
-        from typesense.collections import Collections
-        from typesense.overrides import Overrides
-
         return "/".join(
             [
-                Collections.resource_path,
+                COLLECTIONS,
                 self.collection_name,
-                Overrides.resource_path,
+                OVERRIDES,
                 self.override_id,
             ],
         )
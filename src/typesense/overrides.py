@@ -31,6 +31,7 @@ import sys
 
 from typesense.api_call import ApiCall
 from typesense.override import Override
+from typesense.paths import COLLECTIONS, OVERRIDES
 from typesense.types.override import (
     OverrideCreateSchema,
     OverrideRetrieveSchema,
@@ -57,7 +58,7 @@ class Overrides:
         overrides (Dict[str, Override]): A dictionary of Override objects.
     """
 
-    resource_path: typing.Final[str] = "overrides"
+    resource_path: typing.Final[str] = OVERRIDES
 
     def __init__(
         self,
@@ -85,13 +86,14 @@ class Overrides:
         Returns:
             Override: The Override object for the given ID.
         """
-        if not self.overrides.get(override_id):
-            self.overrides[override_id] = Override(
+        override = self.overrides.get(override_id)
+        if override is None:
+            override = self.overrides[override_id] = Override(
                 self.api_call,
                 self.collection_name,
                 override_id,
             )
-        return self.overrides[override_id]
+        return override
 
     def upsert(self, override_id: str, schema: OverrideCreateSchema) -> OverrideSchema:
         """
@@ -135,13 +137,11 @@ class Overrides:
         Returns:
             str: The constructed endpoint path.
         """
-        from typesense.collections import Collections
-
         override_id = override_id or ""
 
         return "/".join(
             [
-                Collections.resource_path,
+                COLLECTIONS,
                 self.collection_name,
                 Overrides.resource_path,
                 override_id,
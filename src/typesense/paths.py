@@ -0,0 +1,29 @@
+"""
+API resource paths of the Typesense server.
+
+The paths are kept in this module, which imports nothing from the rest of the
+package, so that resource modules can use them at import time. Otherwise a child
+resource, e.g. Document, would have to import its parent resource module, e.g.
+`typesense.collections`, lazily to break the circular import between them.
+
+Top-level paths start with a slash; collection-scoped paths are relative to
+`/collections/<collection_name>`.
+"""
+
+import sys
+
+if sys.version_info >= (3, 11):
+    import typing
+else:
+    import typing_extensions as typing
+
+ALIASES: typing.Final[str] = "/aliases"
+ANALYTICS_RULES: typing.Final[str] = "/analytics/rules"
+COLLECTIONS: typing.Final[str] = "/collections"
+CONVERSATIONS_MODELS: typing.Final[str] = "/conversations/models"
+KEYS: typing.Final[str] = "/keys"
+STOPWORDS: typing.Final[str] = "/stopwords"
+
+DOCUMENTS: typing.Final[str] = "documents"
+OVERRIDES: typing.Final[str] = "overrides"
+SYNONYMS: typing.Final[str] = "synonyms"
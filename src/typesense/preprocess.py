@@ -70,13 +70,16 @@ def stringify(argument: _Types) -> str:
         >>> stringify("Hello")
         'Hello'
     """
-    if not isinstance(argument, (str, int, bool)):
-        raise InvalidParameter(
-            f"Value {argument} is not a string, integer, or boolean.",
-        )
-    if isinstance(argument, (bool, int)):
-        return str(argument).lower()
-    return argument
+    # Strings are by far the most common values, so they are checked first
+    if isinstance(argument, str):
+        return argument
+    if isinstance(argument, bool):
+        return "true" if argument else "false"
+    if isinstance(argument, int):
+        return str(argument)
+    raise InvalidParameter(
+        f"Value {argument} is not a string, integer, or boolean.",
+    )
 
 
 def process_param_list(
@@ -136,9 +139,11 @@ def stringify_search_params(parameter_dict: ParamSchema) -> StringifiedParamSche
     """
     stringified_params: StringifiedParamSchema = {}
     for key, param_value in parameter_dict.items():
-        if isinstance(param_value, list):
+        if isinstance(param_value, str):
+            stringified_params[key] = param_value
+        elif isinstance(param_value, list):
             stringified_params[key] = process_param_list(param_value)
-        elif isinstance(param_value, (bool, int, str)):
+        elif isinstance(param_value, (bool, int)):
             stringified_params[key] = stringify(param_value)
         else:
             raise InvalidParameter(
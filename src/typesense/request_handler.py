@@ -14,18 +14,24 @@ versions through the use of the typing_extensions library.
 
 Key Features:
 - Handles authentication via API key
+- Sends every request through one shared, pooled session
 - Supports JSON and non-JSON responses
 - Provides custom error handling for various HTTP status codes
 - Normalizes boolean parameters for API requests
 
 Note: This module relies on the 'requests' library for making HTTP requests.
+When the optional 'orjson' package is installed, it is used to encode request
+bodies and decode responses; otherwise the standard library 'json' module is used.
 """
 
+import functools
 import json
+import socket
 import sys
 from types import MappingProxyType
 
 import requests
+from urllib3.connection import HTTPConnection
 
 if sys.version_info >= (3, 11):
     import typing
@@ -46,26 +52,74 @@ from typesense.exceptions import (
     TypesenseClientError,
 )
 
+try:
+    import orjson
+except ImportError:
+    _json_dumps: typing.Callable[[typing.Any], typing.Union[str, bytes]] = json.dumps
+    _json_loads: typing.Callable[[bytes], typing.Any] = json.loads
+    _jsonl_separator: typing.Any = "\n"
+else:
+    _json_dumps = functools.partial(orjson.dumps, option=orjson.OPT_NON_STR_KEYS)
+    _json_loads = orjson.loads
+    _jsonl_separator = b"\n"
+
+# Keep enough pooled connections per node for clients shared across threads;
+# requests' default of 10 makes busier threads drop and re-open connections.
+_POOL_MAXSIZE: typing.Final[int] = 32
+
+# Idle time before the first keep-alive probe on a pooled connection
+_KEEPALIVE_IDLE_SECONDS: typing.Final[int] = 60
+
+# urllib3 already disables Nagle's algorithm (TCP_NODELAY). Keep-alive probes are
+# added so that pooled connections silently dropped by the network, e.g. by a
+# firewall's idle timeout, are noticed while idle rather than by the next request.
+_SOCKET_OPTIONS: typing.List[typing.Tuple[int, int, int]] = [
+    *HTTPConnection.default_socket_options,
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+]
+if hasattr(socket, "TCP_KEEPIDLE"):
+    _SOCKET_OPTIONS.append(
+        (socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, _KEEPALIVE_IDLE_SECONDS),
+    )
+
+
+class _KeepAliveAdapter(requests.adapters.HTTPAdapter):
+    """HTTPAdapter whose pooled connections enable TCP keep-alive."""
+
+    def init_poolmanager(self, *args: typing.Any, **pool_kwargs: typing.Any) -> None:
+        """Create the pool manager, with keep-alive socket options by default."""
+        pool_kwargs.setdefault("socket_options", _SOCKET_OPTIONS)
+        super().init_poolmanager(*args, **pool_kwargs)
+
+
+session = requests.sessions.Session()
+_adapter = _KeepAliveAdapter(pool_maxsize=_POOL_MAXSIZE)
+session.mount("http://", _adapter)
+session.mount("https://", _adapter)
+
 TEntityDict = typing.TypeVar("TEntityDict")
 TParams = typing.TypeVar("TParams")
 TBody = typing.TypeVar("TBody")
 
-_ERROR_CODE_MAP: typing.Mapping[str, typing.Type[TypesenseClientError]] = (
+_ERROR_CODE_MAP: typing.Mapping[int, typing.Type[TypesenseClientError]] = (
     MappingProxyType(
         {
-            "0": HTTPStatus0Error,
-            "400": RequestMalformed,
-            "401": RequestUnauthorized,
-            "403": RequestForbidden,
-            "404": ObjectNotFound,
-            "409": ObjectAlreadyExists,
-            "422": ObjectUnprocessable,
-            "500": ServerError,
-            "503": ServiceUnavailable,
+            0: HTTPStatus0Error,
+            400: RequestMalformed,
+            401: RequestUnauthorized,
+            403: RequestForbidden,
+            404: ObjectNotFound,
+            409: ObjectAlreadyExists,
+            422: ObjectUnprocessable,
+            500: ServerError,
+            503: ServiceUnavailable,
         },
     )
 )
 
+# Bodies of these types are already encoded and are sent without re-serializing.
+_ENCODED_BODY_TYPES: typing.Final = (str, bytes, bytearray, memoryview)
+
 
 class SessionFunctionKwargs(typing.Generic[TParams, TBody], typing.TypedDict):
     """
@@ -74,7 +128,7 @@ class SessionFunctionKwargs(typing.Generic[TParams, TBody], typing.TypedDict):
     Attributes:
         params (Optional[Union[TParams, None]]): Query parameters for the request.
 
-        data (Optional[Union[TBody, str, None]]): Body of the request.
+        data (Optional[Union[TBody, str, bytes, None]]): Body of the request.
 
         headers (Optional[Dict[str, str]]): Headers for the request.
 
@@ -84,7 +138,7 @@ class SessionFunctionKwargs(typing.Generic[TParams, TBody], typing.TypedDict):
     """
 
     params: typing.NotRequired[typing.Union[TParams, None]]
-    data: typing.NotRequired[typing.Union[TBody, str, None]]
+    data: typing.NotRequired[typing.Union[TBody, str, bytes, None]]
     headers: typing.NotRequired[typing.Dict[str, str]]
     timeout: float
     verify: bool
@@ -112,11 +166,14 @@ class RequestHandler:
             config (Configuration): The configuration object for the Typesense client.
         """
         self.config = config
+        self._headers: typing.Dict[str, str] = {
+            self.api_key_header_name: config.api_key,
+        }
 
     @typing.overload
     def make_request(
         self,
-        fn: typing.Callable[..., requests.models.Response],
+        method: str,
         url: str,
         entity_type: typing.Type[TEntityDict],
         as_json: typing.Literal[False],
@@ -129,7 +186,7 @@ class RequestHandler:
         should be returned as a raw string instead of being parsed as JSON.
 
         Args:
-            fn (Callable): The HTTP method function to use (e.g., requests.get).
+            method (str): The HTTP method to use (e.g., "GET").
 
             url (str): The URL to send the request to.
 
@@ -149,7 +206,7 @@ class RequestHandler:
     @typing.overload
     def make_request(
         self,
-        fn: typing.Callable[..., requests.models.Response],
+        method: str,
         url: str,
         entity_type: typing.Type[TEntityDict],
         as_json: typing.Literal[True],
@@ -159,7 +216,7 @@ class RequestHandler:
         Make an HTTP request to the Typesense API.
 
         Args:
-            fn (Callable): The HTTP method function to use (e.g., requests.get).
+            method (str): The HTTP method to use (e.g., "GET").
 
             url (str): The URL to send the request to.
 
@@ -178,7 +235,7 @@ class RequestHandler:
 
     def make_request(
         self,
-        fn: typing.Callable[..., requests.models.Response],
+        method: str,
         url: str,
         entity_type: typing.Type[TEntityDict],
         as_json: typing.Union[typing.Literal[True], typing.Literal[False]] = True,
@@ -188,7 +245,7 @@ class RequestHandler:
         Make an HTTP request to the Typesense API.
 
         Args:
-            fn (Callable): The HTTP method function to use (e.g., requests.get).
+            method (str): The HTTP method to use (e.g., "GET").
 
             url (str): The URL to send the request to.
 
@@ -204,27 +261,132 @@ class RequestHandler:
         Raises:
             TypesenseClientError: If the API returns an error response.
         """
-        headers = {self.api_key_header_name: self.config.api_key}
-        kwargs.setdefault("headers", {}).update(headers)
+        response = self._send(method, url, stream=False, **kwargs)
+
+        if as_json:
+            try:
+                res: TEntityDict = _json_loads(response.content)
+            except json.JSONDecodeError as decode_error:
+                # Raise what `response.json()` raises, a RequestException, so that
+                # the request is retried on the next node and callers still catch it
+                raise requests.exceptions.JSONDecodeError(
+                    decode_error.msg,
+                    decode_error.doc,
+                    decode_error.pos,
+                ) from decode_error
+            return res
+
+        # Typesense always answers in UTF-8; decoding directly skips requests'
+        # charset detection, which scans the whole body when no charset is declared.
+        return response.content.decode("utf-8")
+
+    def make_stream_request(
+        self,
+        method: str,
+        url: str,
+        **kwargs: typing.Unpack[SessionFunctionKwargs[TParams, TBody]],
+    ) -> requests.Response:
+        """
+        Make an HTTP request to the Typesense API, leaving the response body unread.
+
+        Args:
+            method (str): The HTTP method to use (e.g., "GET").
+
+            url (str): The URL to send the request to.
+
+            kwargs: Additional keyword arguments for the request.
+
+        Returns:
+            requests.Response: The response; the caller reads and closes it.
+
+        Raises:
+            TypesenseClientError: If the API returns an error response.
+        """
+        return self._send(method, url, stream=True, **kwargs)
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        stream: bool,
+        **kwargs: typing.Unpack[SessionFunctionKwargs[TParams, TBody]],
+    ) -> requests.Response:
+        """
+        Send an HTTP request with the client's headers and raise on error responses.
+
+        Args:
+            method (str): The HTTP method to use (e.g., "GET").
+
+            url (str): The URL to send the request to.
+
+            stream (bool): Whether to leave the response body unread.
+
+            kwargs: Additional keyword arguments for the request.
+
+        Returns:
+            requests.Response: The successful response.
+
+        Raises:
+            TypesenseClientError: If the API returns an error response.
+        """
+        if "headers" in kwargs:
+            kwargs["headers"].update(self._headers)
+        else:
+            # requests copies the headers it sends, so the shared dict is never mutated
+            kwargs["headers"] = self._headers
         kwargs.setdefault("timeout", self.config.connection_timeout_seconds)
         kwargs.setdefault("verify", self.config.verify)
-        if kwargs.get("data") and not isinstance(kwargs["data"], (str, bytes)):
-            kwargs["data"] = json.dumps(kwargs["data"])
 
-        response = fn(url, **kwargs)
+        response = session.request(method, url, stream=stream, **kwargs)
 
-        if response.status_code < 200 or response.status_code >= 300:
-            error_message = self._get_error_message(response)
+        if not 200 <= response.status_code < 300:
+            # Closing releases the connection of a streamed response
+            with response:
+                error_message = self._get_error_message(response)
             raise self._get_exception(response.status_code)(
                 response.status_code,
                 error_message,
             )
+        return response
 
-        if as_json:
-            res: TEntityDict = response.json()
-            return res
+    @staticmethod
+    def serialize_body(
+        body: typing.Union[TBody, str, bytes, None],
+    ) -> typing.Union[TBody, str, bytes, None]:
+        """
+        Encode a request body as JSON, unless it is already serialized or empty.
+
+        Bodies are serialized once per call, before any retries, so `make_request`
+        sends `data` as is. `str` and bytes-like bodies, such as pre-serialized JSONL
+        for a documents import, are passed through unchanged.
+
+        Args:
+            body (Union[TBody, str, bytes, None]): The body to serialize.
+
+        Returns:
+            Union[TBody, str, bytes, None]: The body, ready to be sent.
+        """
+        if not body or isinstance(body, _ENCODED_BODY_TYPES):
+            return body
+        return _json_dumps(body)
 
-        return response.text
+    @staticmethod
+    def serialize_jsonl(items: typing.Sequence[typing.Any]) -> typing.Union[str, bytes]:
+        """
+        Encode items as JSON Lines, one JSON document per line.
+
+        With orjson the lines are joined as bytes, without decoding each one.
+
+        Args:
+            items (Sequence[Any]): The items to serialize.
+
+        Returns:
+            Union[str, bytes]: The JSONL payload.
+        """
+        jsonl: typing.Union[str, bytes] = _jsonl_separator.join(
+            [_json_dumps(item) for item in items],
+        )
+        return jsonl
 
     @staticmethod
     def normalize_params(params: TParams) -> None:
@@ -255,10 +417,17 @@ class RequestHandler:
             str: The extracted error message or a default message.
         """
         content_type = response.headers.get("Content-Type", "")
-        if content_type.startswith("application/json"):
-            err_message: str = response.json().get("message", "API error.")
-            return err_message
-        return "API error."
+        if not content_type.startswith("application/json"):
+            return "API error."
+        try:
+            error_body = _json_loads(response.content)
+        except ValueError:
+            # A malformed error body must not hide the HTTP error itself
+            return "API error."
+        if not isinstance(error_body, dict):
+            return "API error."
+        err_message: str = error_body.get("message", "API error.")
+        return err_message
 
     @staticmethod
     def _get_exception(http_code: int) -> typing.Type[TypesenseClientError]:
@@ -271,4 +440,4 @@ class RequestHandler:
         Returns:
             Type[TypesenseClientError]: The exception type corresponding to the status code.
         """
-        return _ERROR_CODE_MAP.get(str(http_code), TypesenseClientError)
+        return _ERROR_CODE_MAP.get(http_code, TypesenseClientError)
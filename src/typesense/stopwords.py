@@ -24,6 +24,7 @@ versions through the use of the typing_extensions library.
 import sys
 
 from typesense.api_call import ApiCall
+from typesense.paths import STOPWORDS
 from typesense.stopwords_set import StopwordsSet
 from typesense.types.stopword import (
     StopwordCreateSchema,
@@ -50,7 +51,7 @@ class Stopwords:
         stopwords_sets (Dict[str, StopwordsSet]): A dictionary of StopwordsSet objects.
     """
 
-    resource_path: typing.Final[str] = "/stopwords"
+    resource_path: typing.Final[str] = STOPWORDS
 
     def __init__(self, api_call: ApiCall):
         """
@@ -72,12 +73,13 @@ class Stopwords:
         Returns:
             StopwordsSet: The StopwordsSet object for the given ID.
         """
-        if not self.stopwords_sets.get(stopwords_set_id):
-            self.stopwords_sets[stopwords_set_id] = StopwordsSet(
+        stopwords_set = self.stopwords_sets.get(stopwords_set_id)
+        if stopwords_set is None:
+            stopwords_set = self.stopwords_sets[stopwords_set_id] = StopwordsSet(
                 self.api_call,
                 stopwords_set_id,
             )
-        return self.stopwords_sets[stopwords_set_id]
+        return stopwords_set
 
     def upsert(
         self,
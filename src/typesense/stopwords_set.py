@@ -21,6 +21,7 @@ versions through the use of the typing_extensions library.
 """
 
 from typesense.api_call import ApiCall
+from typesense.paths import STOPWORDS
 from typesense.types.stopword import StopwordDeleteSchema, StopwordsSingleRetrieveSchema
 
 
@@ -82,6 +83,4 @@ class StopwordsSet:
         Returns:
             str: The constructed endpoint path.
         """
-        from typesense.stopwords import Stopwords
-
-        return "/".join([Stopwords.resource_path, self.stopwords_set_id])
+        return "/".join([STOPWORDS, self.stopwords_set_id])
@@ -22,6 +22,7 @@ versions through the use of the typing_extensions library.
 """
 
 from typesense.api_call import ApiCall
+from typesense.paths import COLLECTIONS, SYNONYMS
 from typesense.types.synonym import SynonymDeleteSchema, SynonymSchema
 
 
@@ -84,14 +85,11 @@ class Synonym:
         Returns:
             str: The constructed endpoint path.
         """
-        from typesense.collections import Collections
-        from typesense.synonyms import Synonyms
-
         return "/".join(
             [
-                Collections.resource_path,
+                COLLECTIONS,
                 self.collection_name,
-                Synonyms.resource_path,
+                SYNONYMS,
                 self.synonym_id,
             ],
         )
@@ -28,6 +28,7 @@ versions through the use of the typing_extensions library.
 import sys
 
 from typesense.api_call import ApiCall
+from typesense.paths import COLLECTIONS, SYNONYMS
 from typesense.synonym import Synonym
 from typesense.types.synonym import (
     SynonymCreateSchema,
@@ -55,7 +56,7 @@ class Synonyms:
         synonyms (Dict[str, Synonym]): A dictionary of Synonym objects.
     """
 
-    resource_path: typing.Final[str] = "synonyms"
+    resource_path: typing.Final[str] = SYNONYMS
 
     def __init__(self, api_call: ApiCall, collection_name: str):
         """
@@ -79,13 +80,14 @@ class Synonyms:
         Returns:
             Synonym: The Synonym object for the given ID.
         """
-        if not self.synonyms.get(synonym_id):
-            self.synonyms[synonym_id] = Synonym(
+        synonym = self.synonyms.get(synonym_id)
+        if synonym is None:
+            synonym = self.synonyms[synonym_id] = Synonym(
                 self.api_call,
                 self.collection_name,
                 synonym_id,
             )
-        return self.synonyms[synonym_id]
+        return synonym
 
     def upsert(self, synonym_id: str, schema: SynonymCreateSchema) -> SynonymSchema:
         """
@@ -128,12 +130,10 @@ class Synonyms:
         Returns:
             str: The constructed endpoint path.
         """
-        from typesense.collections import Collections
-
         synonym_id = synonym_id or ""
         return "/".join(
             [
-                Collections.resource_path,
+                COLLECTIONS,
                 self.collection_name,
                 Synonyms.resource_path,
                 synonym_id,
@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import gc
+import json
 import logging
+import socket
 import sys
+import threading
 import time
 
 from pytest_mock import MockFixture
@@ -19,10 +23,13 @@ import requests_mock
 from pytest_mock import MockerFixture
 
 from tests.utils.object_assertions import assert_match_object, assert_object_lists_match
-from typesense import exceptions
+from typesense import exceptions, request_handler
 from typesense.api_call import ApiCall, RequestHandler
-from typesense.configuration import Configuration, Node
+from typesense.api_call import session as api_call_session
+from typesense.configuration import ConfigDict, Configuration, Node
 from typesense.logger import logger
+from typesense.node_manager import HealthChecker, NodeManager
+from typesense.request_handler import session
 
 
 def test_initialization(
@@ -35,12 +42,37 @@ def test_initialization(
     assert fake_api_call.node_manager.node_index == 0
 
 
+def test_api_call_is_slotted(fake_api_call: ApiCall) -> None:
+    """Test that ApiCall instances store their attributes in slots."""
+    assert not hasattr(fake_api_call, "__dict__")
+
+
+def test_node_manager_does_not_share_config_nodes(
+    fake_api_call: ApiCall,
+) -> None:
+    """Test that marking a node unhealthy does not touch the configuration's node."""
+    fake_api_call.node_manager.nodes[0].healthy = False
+
+    assert fake_api_call.config.nodes[0].healthy is True
+
+
+def test_node_manager_does_not_share_config_nearest_node(
+    fake_config: Configuration,
+) -> None:
+    """Test that NodeManagers built from one configuration track health apart."""
+    node_manager = NodeManager(fake_config)
+    node_manager.nearest_node.healthy = False
+
+    assert fake_config.nearest_node.healthy is True
+    assert NodeManager(fake_config).nearest_node.healthy is True
+
+
 def test_node_due_for_health_check(
     fake_api_call: ApiCall,
 ) -> None:
     """Test that it correctly identifies if a node is due for health check."""
     node = Node(host="localhost", port=8108, protocol="http", path=" ")
-    node.last_access_ts = time.time() - 61
+    node.last_access_ts = int(time.monotonic()) - 61
     assert fake_api_call.node_manager._is_due_for_health_check(node) is True
 
 
@@ -56,7 +88,7 @@ def test_get_node_nearest_not_healthy(
     fake_api_call: ApiCall,
 ) -> None:
     """Test that it selects the next available node if the nearest node is not healthy."""
-    fake_api_call.config.nearest_node.healthy = False
+    fake_api_call.node_manager.nearest_node.healthy = False
     node = fake_api_call.node_manager.get_node()
     assert_match_object(node, fake_api_call.node_manager.nodes[0])
 
@@ -66,8 +98,8 @@ def test_get_node_round_robin_selection(
     mocker: MockerFixture,
 ) -> None:
     """Test that it selects the next available node in a round-robin fashion."""
-    fake_api_call.config.nearest_node = None
-    mocker.patch("time.time", return_value=100)
+    fake_api_call.node_manager.nearest_node = None
+    mocker.patch("time.monotonic", return_value=100)
 
     node1 = fake_api_call.node_manager.get_node()
     assert_match_object(node1, fake_api_call.config.nodes[0])
@@ -79,6 +111,124 @@ def test_get_node_round_robin_selection(
     assert_match_object(node3, fake_api_call.config.nodes[2])
 
 
+def test_get_node_reads_clock_once_per_scan(
+    fake_api_call: ApiCall,
+    mocker: MockerFixture,
+) -> None:
+    """Test that it reads the clock once when scanning unhealthy nodes."""
+    fake_api_call.node_manager.nearest_node = None
+    for api_node in fake_api_call.node_manager.nodes:
+        api_node.healthy = False
+    clock = mocker.patch("time.monotonic", return_value=time.monotonic())
+
+    fake_api_call.node_manager.get_node()
+
+    assert clock.call_count == 1
+
+
+def test_base_url_is_formatted_once(
+    fake_api_call: ApiCall,
+    mocker: MockerFixture,
+) -> None:
+    """Test that it formats a node's base URL only on first use."""
+    node_manager = fake_api_call.node_manager
+    node = node_manager.nodes[0]
+
+    assert node_manager.base_url(node) == "http://node0:8108"
+
+    node_url = mocker.patch.object(node, "url")
+
+    assert node_manager.base_url(node) == "http://node0:8108"
+    node_url.assert_not_called()
+
+
+def test_health_checker_records_probe_results(
+    fake_api_call: ApiCall,
+) -> None:
+    """Test that probing marks each node healthy only if it answers with 200."""
+    node_manager = fake_api_call.node_manager
+    health_checker = HealthChecker(node_manager)
+
+    with requests_mock.mock() as request_mocker:
+        request_mocker.get("http://nearest:8108/health", json={"ok": True})
+        request_mocker.get(
+            "http://node0:8108/health",
+            json={"ok": False},
+            status_code=503,
+        )
+        request_mocker.get(
+            "http://node1:8108/health",
+            exc=requests.exceptions.ConnectTimeout,
+        )
+        request_mocker.get("http://node2:8108/health", json={"ok": True})
+
+        health_checker.probe_nodes()
+
+    assert fake_api_call.node_manager.nearest_node.healthy is True
+    assert [api_node.healthy for api_node in node_manager.nodes] == [
+        False,
+        False,
+        True,
+    ]
+
+
+def test_health_checker_runs_only_when_enabled(fake_config_dict: ConfigDict) -> None:
+    """Test that the background health checker is started only on request."""
+    assert NodeManager(Configuration(fake_config_dict)).health_checker is None
+
+    node_manager = NodeManager(
+        Configuration({**fake_config_dict, "background_healthcheck": True}),
+    )
+    health_checker = node_manager.health_checker
+
+    assert health_checker is not None
+    assert health_checker.daemon is True
+    assert health_checker.is_alive() is True
+
+    node_manager.close()
+    assert health_checker.is_alive() is False
+
+
+def test_node_manager_close_stops_health_checker(
+    fake_config_dict: ConfigDict,
+    mocker: MockerFixture,
+) -> None:
+    """Test that closing the NodeManager joins the thread and closes its session."""
+    with NodeManager(
+        Configuration({**fake_config_dict, "background_healthcheck": True}),
+    ) as node_manager:
+        health_checker = node_manager.health_checker
+        assert health_checker is not None
+        close_session = mocker.spy(health_checker.session, "close")
+
+    assert health_checker.is_alive() is False
+    close_session.assert_called_once_with()
+    assert node_manager.health_checker is None
+
+    node_manager.close()
+
+
+def test_health_checker_probes_nodes_concurrently(
+    fake_api_call: ApiCall,
+    mocker: MockerFixture,
+) -> None:
+    """Test that a slow node does not hold back the probes of the other nodes."""
+    node_manager = fake_api_call.node_manager
+    health_checker = HealthChecker(node_manager)
+    # Every probe waits for all the others, so sequential probes break the barrier
+    barrier = threading.Barrier(len(node_manager.nodes) + 1, timeout=1)
+    mocker.patch.object(
+        health_checker,
+        "_is_healthy",
+        side_effect=lambda node: barrier.wait() >= 0,
+    )
+
+    health_checker.probe_nodes()
+
+    assert node_manager.nearest_node.healthy is True
+    assert [api_node.healthy for api_node in node_manager.nodes] == [True] * 3
+
+
 def test_get_exception() -> None:
     """Test that it correctly returns the exception class for a given status code."""
     assert RequestHandler._get_exception(0) == exceptions.HTTPStatus0Error
@@ -135,11 +285,105 @@ def test_normalize_params_with_no_booleans() -> None:
     assert parameter_dict == {"key1": "value", "key2": 123}
 
 
+@pytest.mark.parametrize(
+    "body",
+    [
+        '{"id": "0"}',
+        b'{"id": "0"}',
+        bytearray(b'{"id": "0"}'),
+        memoryview(b'{"id": "0"}'),
+    ],
+    ids=["str", "bytes", "bytearray", "memoryview"],
+)
+def test_serialize_body_passes_encoded_bodies_through(
+    body: typing.Union[str, bytes, bytearray, memoryview],
+) -> None:
+    """Test that it sends already encoded bodies without re-serializing them."""
+    assert RequestHandler.serialize_body(body) is body
+
+
+def test_session_is_reexported() -> None:
+    """Test that the shared session can still be imported from typesense.api_call."""
+    assert api_call_session is session
+
+
+def test_session_enables_tcp_keepalive() -> None:
+    """Test that pooled connections keep Nagle disabled and enable keep-alive."""
+    adapter = session.get_adapter("http://node0:8108")
+    socket_options = adapter.poolmanager.connection_pool_kw["socket_options"]
+
+    assert (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1) in socket_options
+    assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in socket_options
+
+
+def test_serialize_jsonl() -> None:
+    """Test that it encodes one JSON document per line."""
+    jsonl = RequestHandler.serialize_jsonl([{"id": "0"}, {"id": "1"}])
+
+    if isinstance(jsonl, bytes):
+        jsonl = jsonl.decode("utf-8")
+    assert [json.loads(line) for line in jsonl.split("\n")] == [
+        {"id": "0"},
+        {"id": "1"},
+    ]
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        {"id": "0", "title": "Caf\u00e9 \u2603", "tags": ["a", "b"], "rating": 4.5},
+        {"nested": {"flag": True, "empty": None}, "count": 2**40},
+        {1: "integer key"},
+    ],
+)
+def test_orjson_serialization_matches_json(
+    body: typing.Dict[typing.Any, typing.Any]
+) -> None:
+    """Test that bodies encoded with orjson decode to the same JSON as with json."""
+    pytest.importorskip("orjson")
+    assert request_handler._json_dumps is not json.dumps  # noqa: WPS437
+
+    assert json.loads(RequestHandler.serialize_body(body)) == json.loads(
+        json.dumps(body),
+    )
+    jsonl = RequestHandler.serialize_jsonl([body, body])
+    assert isinstance(jsonl, bytes)
+    assert [json.loads(line) for line in jsonl.split(b"\n")] == [
+        json.loads(json.dumps(body)),
+    ] * 2
+
+
+def test_non_json_response_is_retried_on_next_node(
+    fake_api_call: ApiCall,
+) -> None:
+    """Test that an undecodable 2xx body is retried like other request errors."""
+    with requests_mock.mock() as request_mocker:
+        request_mocker.get("http://nearest:8108/", text="<html>")
+        request_mocker.get("http://node0:8108/", json={"key": "value"})
+
+        response = fake_api_call.get("/", entity_type=typing.Dict[str, str])
+
+        assert request_mocker.call_count == 2
+
+    assert response == {"key": "value"}
+
+
+def test_non_json_response_raises_requests_error(
+    fake_api_call: ApiCall,
+) -> None:
+    """Test that an undecodable body raises requests' JSONDecodeError in the end."""
+    with requests_mock.mock() as request_mocker:
+        request_mocker.get(requests_mock.ANY, text="<html>")
+
+        with pytest.raises(requests.exceptions.JSONDecodeError):
+            fake_api_call.get("/", entity_type=typing.Dict[str, str])
+
+        assert request_mocker.call_count == 4
+
+
 def test_make_request_as_json(fake_api_call: ApiCall) -> None:
     """Test the `make_request` method with JSON response."""
-    session = requests.sessions.Session()
-
-    with requests_mock.mock(session=session) as request_mocker:
+    with requests_mock.mock() as request_mocker:
         request_mocker.get(
             "http://nearest:8108/test",
             json={"key": "value"},
@@ -147,7 +391,7 @@ def test_make_request_as_json(fake_api_call: ApiCall) -> None:
         )
 
         response = fake_api_call._execute_request(
-            session.get,
+            "GET",
             "/test",
             as_json=True,
             entity_type=typing.Dict[str, str],
@@ -157,9 +401,7 @@ def test_make_request_as_json(fake_api_call: ApiCall) -> None:
 
 def test_make_request_as_text(fake_api_call: ApiCall) -> None:
     """Test the `make_request` method with text response."""
-    session = requests.sessions.Session()
-
-    with requests_mock.mock(session=session) as request_mocker:
+    with requests_mock.mock() as request_mocker:
         request_mocker.get(
             "http://nearest:8108/test",
             text="response text",
@@ -167,7 +409,7 @@ def test_make_request_as_text(fake_api_call: ApiCall) -> None:
         )
 
         response = fake_api_call._execute_request(
-            session.get,
+            "GET",
             "/test",
             as_json=False,
             entity_type=typing.Dict[str, str],
@@ -192,6 +434,22 @@ def test_get_as_json(
         ) == {"key": "value"}
 
 
+def test_sends_api_key_header(
+    fake_api_call: ApiCall,
+) -> None:
+    """Test that every request carries the API key header."""
+    with requests_mock.mock() as request_mocker:
+        request_mocker.get("http://nearest:8108/test", json={})
+
+        fake_api_call.get("/test", entity_type=typing.Dict[str, str])
+        fake_api_call.get("/test", entity_type=typing.Dict[str, str])
+
+        assert [
+            request.headers["X-TYPESENSE-API-KEY"]
+            for request in request_mocker.request_history
+        ] == ["test-api-key", "test-api-key"]
+
+
 def test_get_as_text(
     fake_api_call: ApiCall,
 ) -> None:
@@ -208,6 +466,111 @@ def test_get_as_text(
         )
 
 
+def test_get_as_text_decodes_utf8(
+    fake_api_call: ApiCall,
+) -> None:
+    """Test that text responses are decoded as UTF-8 whatever the content type."""
+    with requests_mock.mock() as request_mocker:
+        request_mocker.get(
+            "http://nearest:8108/test",
+            content='{"name": "Café"}'.encode(),
+            headers={"Content-Type": "text/plain"},
+        )
+        assert (
+            fake_api_call.get("/test", as_json=False, entity_type=typing.Dict[str, str])
+            == '{"name": "Café"}'
+        )
+
+
+def test_get_lines(fake_api_call: ApiCall) -> None:
+    """Test that it streams the lines of a GET response."""
+    with requests_mock.Mocker() as request_mocker:
+        request_mocker.get(
+            "http://nearest:8108/test",
+            content='{"id": "0"}\n{"name": "Zoë"}'.encode("utf-8"),
+            headers={"Content-Type": "text/plain"},
+        )
+
+        lines = fake_api_call.get_lines("/test", params={"a": True})
+
+        assert list(lines) == ['{"id": "0"}', '{"name": "Zoë"}']
+        assert request_mocker.last_request.qs == {"a": ["true"]}
+
+
+def test_get_lines_closes_abandoned_response(
+    fake_api_call: ApiCall,
+    mocker: MockerFixture,
+) -> None:
+    """Test that it closes the response when the iteration is abandoned."""
+    close = mocker.spy(requests.Response, "close")
+
+    with requests_mock.Mocker() as request_mocker:
+        request_mocker.get("http://nearest:8108/test", text="first\nsecond")
+
+        lines = fake_api_call.get_lines("/test")
+        assert next(lines) == "first"
+        lines.close()
+
+    close.assert_called_once()
+
+
+def test_get_lines_closes_unread_response(
+    fake_api_call: ApiCall,
+    mocker: MockerFixture,
+) -> None:
+    """Test that it closes the response of lines that are never iterated."""
+    close = mocker.spy(requests.Response, "close")
+
+    with requests_mock.Mocker() as request_mocker:
+        request_mocker.get("http://nearest:8108/test", text="first\nsecond")
+
+        with fake_api_call.get_lines("/test"):
+            close.assert_not_called()
+
+        close.assert_called_once()
+
+        fake_api_call.get_lines("/test")
+        gc.collect()
+
+    assert close.call_count == 2
+
+
+def test_get_lines_retries_on_another_node(fake_api_call: ApiCall) -> None:
+    """Test that it retries the streamed request on the next node."""
+    with requests_mock.Mocker() as request_mocker:
+        request_mocker.get(
+            "http://nearest:8108/test",
+            exc=requests.exceptions.ConnectTimeout,
+        )
+        request_mocker.get("http://node0:8108/test", text="first\nsecond")
+
+        with fake_api_call.get_lines("/test") as lines:
+            assert list(lines) == ["first", "second"]
+
+    assert fake_api_call.node_manager.nearest_node.healthy is False
+    assert fake_api_call.node_manager.nodes[0].healthy is True
+
+
+def test_get_lines_raises_before_iterating(
+    fake_api_call: ApiCall,
+    mocker: MockerFixture,
+) -> None:
+    """Test that it raises API errors when called, and closes the response."""
+    close = mocker.spy(requests.Response, "close")
+
+    with requests_mock.Mocker() as request_mocker:
+        request_mocker.get(
+            "http://nearest:8108/test",
+            json={"message": "Not Found"},
+            status_code=404,
+        )
+
+        with pytest.raises(exceptions.ObjectNotFound):
+            fake_api_call.get_lines("/test")
+
+    close.assert_called_once()
+
+
 def test_post_as_json(
     fake_api_call: ApiCall,
 ) -> None:
@@ -343,7 +706,7 @@ def test_raise_custom_exception_with_header(
 
         with pytest.raises(exceptions.RequestMalformed) as exception:
             fake_api_call._execute_request(
-                requests.get,
+                "GET",
                 "/test",
                 as_json=True,
                 entity_type=typing.Dict[str, str],
@@ -364,7 +727,7 @@ def test_raise_custom_exception_without_header(
 
         with pytest.raises(exceptions.RequestMalformed) as exception:
             fake_api_call._execute_request(
-                requests.get,
+                "GET",
                 "/test",
                 as_json=True,
                 entity_type=typing.Dict[str, str],
@@ -372,12 +735,33 @@ def test_raise_custom_exception_without_header(
             assert str(exception.value) == "[Errno 400] API error."
 
 
+def test_raise_custom_exception_with_malformed_json(
+    fake_api_call: ApiCall,
+) -> None:
+    """Test that a malformed JSON error body still raises the HTTP error."""
+    with requests_mock.mock() as request_mocker:
+        request_mocker.get(
+            "http://nearest:8108/test",
+            text='{"message": "Test',
+            status_code=400,
+            headers={"Content-Type": "application/json"},
+        )
+
+        with pytest.raises(exceptions.RequestMalformed, match="API error."):
+            fake_api_call._execute_request(
+                "GET",
+                "/test",
+                as_json=True,
+                entity_type=typing.Dict[str, str],
+            )
+
+
 def test_selects_next_available_node_on_timeout(
     fake_api_call: ApiCall,
 ) -> None:
     """Test that it selects the next available node if the request times out."""
     with requests_mock.mock() as request_mocker:
-        fake_api_call.config.nearest_node = None
+        fake_api_call.node_manager.nearest_node = None
         request_mocker.get(
             "http://node0:8108/test",
             exc=requests.exceptions.ConnectTimeout,
@@ -405,6 +789,36 @@ def test_selects_next_available_node_on_timeout(
         assert request_mocker.call_count == 3
 
 
+def test_body_is_serialized_once_across_retries(
+    fake_api_call: ApiCall,
+    mocker: MockerFixture,
+) -> None:
+    """Test that a retried request reuses the already serialized body."""
+    json_dumps = mocker.patch(
+        "typesense.request_handler._json_dumps",
+        side_effect=json.dumps,
+    )
+
+    with requests_mock.mock() as request_mocker:
+        request_mocker.post(
+            "http://nearest:8108/test",
+            exc=requests.exceptions.ConnectTimeout,
+        )
+        request_mocker.post("http://node0:8108/test", json={"key": "value"})
+
+        fake_api_call.post(
+            "/test",
+            body={"key": "value"},
+            entity_type=typing.Dict[str, str],
+        )
+
+        assert [request.json() for request in request_mocker.request_history] == [
+            {"key": "value"},
+            {"key": "value"},
+        ]
+    json_dumps.assert_called_once_with({"key": "value"})
+
+
 def test_get_node_no_healthy_nodes(
     fake_api_call: ApiCall,
     mocker: MockFixture,
@@ -414,7 +828,7 @@ def test_get_node_no_healthy_nodes(
     for api_node in fake_api_call.node_manager.nodes:
         api_node.healthy = False
 
-    fake_api_call.config.nearest_node.healthy = False
+    fake_api_call.node_manager.nearest_node.healthy = False
 
     mocker.patch.object(
         fake_api_call.node_manager,
@@ -431,7 +845,8 @@ def test_get_node_no_healthy_nodes(
         assert "No healthy nodes were found. Returning the next node." in caplog.text
 
     assert (
-        selected_node == fake_api_call.node_manager.nodes[fake_api_call.node_manager.node_index]
+        selected_node
+        == fake_api_call.node_manager.nodes[fake_api_call.node_manager.node_index]
     )
 
     assert fake_api_call.node_manager.node_index == 0
@@ -454,6 +869,77 @@ def test_raises_if_no_nodes_are_healthy_with_the_last_exception(
             fake_api_call.get("/", entity_type=typing.Dict[str, str])
 
 
+def test_fails_over_to_other_nodes_without_waiting(
+    fake_api_call: ApiCall,
+    mocker: MockerFixture,
+) -> None:
+    """Test that it does not sleep before retrying on a different node."""
+    sleep = mocker.patch("time.sleep")
+
+    with requests_mock.mock() as request_mocker:
+        request_mocker.get(
+            "http://nearest:8108/",
+            exc=requests.exceptions.ConnectTimeout,
+        )
+        request_mocker.get("http://node0:8108/", exc=requests.exceptions.ConnectTimeout)
+        request_mocker.get("http://node1:8108/", exc=requests.exceptions.ConnectTimeout)
+        request_mocker.get("http://node2:8108/", exc=requests.exceptions.ConnectTimeout)
+
+        with pytest.raises(requests.exceptions.ConnectTimeout):
+            fake_api_call.get("/", entity_type=typing.Dict[str, str])
+
+    sleep.assert_not_called()
+
+
+def test_retries_same_node_back_off_exponentially_with_jitter(
+    mocker: MockerFixture,
+) -> None:
+    """Test that it sleeps for a growing, jittered delay when retrying one node."""
+    sleep = mocker.patch("time.sleep")
+    mocker.patch("random.uniform", return_value=0.1)
+    api_call = ApiCall(
+        Configuration(
+            {
+                "api_key": "test-api-key",
+                "nodes": [{"host": "node0", "port": 8108, "protocol": "http"}],
+                "num_retries": 3,
+                "retry_interval_seconds": 0.001,
+            },
+        ),
+    )
+
+    with requests_mock.mock() as request_mocker:
+        request_mocker.get("http://node0:8108/", exc=requests.exceptions.ConnectTimeout)
+
+        with pytest.raises(requests.exceptions.ConnectTimeout):
+            api_call.get("/", entity_type=typing.Dict[str, str])
+
+    delays = [sleep_call.args[0] for sleep_call in sleep.call_args_list]
+    assert delays == pytest.approx([0.0011, 0.0022, 0.0044])
+
+
+def test_retry_delay_is_never_negative(
+    fake_api_call: ApiCall,
+    mocker: MockerFixture,
+) -> None:
+    """Test that the retry delay is clamped at zero."""
+    mocker.patch("random.uniform", return_value=0)
+    fake_api_call.config.retry_backoff_multiplier = -1
+
+    assert fake_api_call._retry_delay(1) == 0
+
+
+def test_retry_delay_is_capped_after_jitter(
+    fake_api_call: ApiCall,
+    mocker: MockerFixture,
+) -> None:
+    """Test that the jittered retry delay never exceeds the maximum interval."""
+    mocker.patch("random.uniform", return_value=0.2)
+    fake_api_call.config.retry_max_interval_seconds = 0.002
+
+    assert fake_api_call._retry_delay(5) == 0.002
+
+
 def test_uses_nearest_node_if_present_and_healthy(  # noqa: WPS213
     mocker: MockerFixture,
     fake_api_call: ApiCall,
@@ -473,8 +959,8 @@ def test_uses_nearest_node_if_present_and_healthy(  # noqa: WPS213
         )
 
         # Freeze time
-        current_time = time.time()
-        mocker.patch("time.time", return_value=current_time)
+        current_time = time.monotonic()
+        mocker.patch("time.monotonic", return_value=current_time)
 
         # Perform the requests
 
@@ -489,14 +975,14 @@ def test_uses_nearest_node_if_present_and_healthy(  # noqa: WPS213
         fake_api_call.get("/", entity_type=typing.Dict[str, str])
 
         # Advance time by 5 seconds
-        mocker.patch("time.time", return_value=current_time + 5)
+        mocker.patch("time.monotonic", return_value=current_time + 5)
         fake_api_call.get(
             "/",
             entity_type=typing.Dict[str, str],
         )  # 1 should go to node2 and resolve the request: 1 request
 
         # Advance time by 65 seconds
-        mocker.patch("time.time", return_value=current_time + 65)
+        mocker.patch("time.monotonic", return_value=current_time + 65)
 
         # 1 should go to nearest,
         # 2 should go to node0,
@@ -505,7 +991,7 @@ def test_uses_nearest_node_if_present_and_healthy(  # noqa: WPS213
         fake_api_call.get("/", entity_type=typing.Dict[str, str])
 
         # Advance time by 185 seconds
-        mocker.patch("time.time", return_value=current_time + 185)
+        mocker.patch("time.monotonic", return_value=current_time + 185)
 
         # Resolve the request on the nearest node
         request_mocker.get(
@@ -549,7 +1035,7 @@ def test_max_retries_no_last_exception(fake_api_call: ApiCall) -> None:
         match="All nodes are unhealthy",
     ):
         fake_api_call._execute_request(
-            requests.get,
+            "GET",
             "/",
             as_json=True,
             entity_type=typing.Dict[str, str],
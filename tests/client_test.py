@@ -34,6 +34,17 @@ def test_client_init(fake_config_dict: ConfigDict) -> None:
     assert fake_client.debug
 
 
+def test_client_close_stops_health_checker(fake_config_dict: ConfigDict) -> None:
+    """Test that leaving the Client context stops the background health checker."""
+    with Client({**fake_config_dict, "background_healthcheck": True}) as client:
+        health_checker = client.api_call.node_manager.health_checker
+        assert health_checker is not None
+        assert health_checker.is_alive() is True
+
+    assert health_checker.is_alive() is False
+    assert client.api_call.node_manager.health_checker is None
+
+
 def test_get_collection(fake_client: Client) -> None:
     """Test the Client class get_collection method."""
     collection = fake_client.typed_collection(model=Companies, name="companies")
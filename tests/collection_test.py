@@ -35,6 +35,16 @@ def test_init(fake_api_call: ApiCall) -> None:
     assert collection._endpoint_path == "/collections/companies"  # noqa: WPS437
 
 
+def test_rename_rebuilds_endpoint_path(fake_api_call: ApiCall) -> None:
+    """Test that assigning the name updates the endpoint path built from it."""
+    collection = Collection(fake_api_call, "companies")
+
+    collection.name = "people"
+
+    assert collection.name == "people"
+    assert collection._endpoint_path == "/collections/people"  # noqa: WPS437
+
+
 def test_retrieve(fake_collection: Collection) -> None:
     """Test that the Collection object can retrieve a collection."""
     time_now = int(time.time())
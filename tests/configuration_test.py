@@ -50,6 +50,9 @@ def test_configuration_defaults() -> None:
         "connection_timeout_seconds": 3.0,
         "num_retries": 3,
         "retry_interval_seconds": 1.0,
+        "retry_backoff_multiplier": 2.0,
+        "retry_max_interval_seconds": 10.0,
+        "retry_jitter": 0.2,
         "verify": True,
     }
 
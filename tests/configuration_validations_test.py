@@ -199,3 +199,63 @@ def test_validate_config_dict_with_wrong_nearest_node() -> None:
                 "api_key": "xyz",
             },
         )
+
+
+def test_validate_config_dict_with_negative_retry_interval() -> None:
+    """Test validate_config_dict with a negative retry interval."""
+    with pytest.raises(
+        ConfigError,
+        match="`retry_interval_seconds` must not be negative.",
+    ):
+        ConfigurationValidations.validate_config_dict(
+            {
+                "nodes": [DEFAULT_NODE],
+                "api_key": "xyz",
+                "retry_interval_seconds": -1,
+            },
+        )
+
+
+def test_validate_config_dict_with_negative_retry_max_interval() -> None:
+    """Test validate_config_dict with a negative maximum retry interval."""
+    with pytest.raises(
+        ConfigError,
+        match="`retry_max_interval_seconds` must not be negative.",
+    ):
+        ConfigurationValidations.validate_config_dict(
+            {
+                "nodes": [DEFAULT_NODE],
+                "api_key": "xyz",
+                "retry_max_interval_seconds": -1,
+            },
+        )
+
+
+def test_validate_config_dict_with_negative_retry_backoff_multiplier() -> None:
+    """Test validate_config_dict with a negative retry backoff multiplier."""
+    with pytest.raises(
+        ConfigError,
+        match="`retry_backoff_multiplier` must not be negative.",
+    ):
+        ConfigurationValidations.validate_config_dict(
+            {
+                "nodes": [DEFAULT_NODE],
+                "api_key": "xyz",
+                "retry_backoff_multiplier": -1,
+            },
+        )
+
+
+@pytest.mark.parametrize("retry_jitter", [-0.1, 1.5])
+def test_validate_config_dict_with_out_of_range_retry_jitter(
+    retry_jitter: float,
+) -> None:
+    """Test validate_config_dict with a retry jitter outside of [0, 1]."""
+    with pytest.raises(ConfigError, match="`retry_jitter` must be between 0 and 1."):
+        ConfigurationValidations.validate_config_dict(
+            {
+                "nodes": [DEFAULT_NODE],
+                "api_key": "xyz",
+                "retry_jitter": retry_jitter,
+            },
+        )
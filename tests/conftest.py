@@ -1,12 +1,35 @@
 """Pytest configuration file."""
 
+import os
+import sys
 from glob import glob
 
 import pytest
 
+if sys.version_info >= (3, 11):
+    import typing
+else:
+    import typing_extensions as typing
+
 pytest.register_assert_rewrite("utils.object_assertions")
 
 pytest_plugins = [
     fixture_file.replace("/", ".").replace(".py", "")
     for fixture_file in glob("**/tests/fixtures/[!__]*.py", recursive=True)
 ]
+
+RUN_INTEGRATION = os.environ.get("TYPESENSE_INTEGRATION") == "1"
+
+
+def pytest_collection_modifyitems(items: typing.List[pytest.Item]) -> None:
+    """Mark tests that talk to a Typesense server, and skip them unless enabled."""
+    skip_integration = pytest.mark.skip(
+        reason="set TYPESENSE_INTEGRATION=1 to run against a Typesense server",
+    )
+    for item in items:
+        fixturenames = getattr(item, "fixturenames", ())
+        if not any(name.startswith("actual_") for name in fixturenames):
+            continue
+        item.add_marker(pytest.mark.integration)
+        if not RUN_INTEGRATION:
+            item.add_marker(skip_integration)
@@ -4,7 +4,6 @@ from __future__ import annotations
 
 import pytest
 import requests_mock
-from dotenv import load_dotenv
 
 from tests.utils.object_assertions import (
     assert_match_object,
@@ -19,8 +18,6 @@ from typesense.types.conversations_model import (
     ConversationModelSchema,
 )
 
-load_dotenv()
-
 
 def test_init(fake_api_call: ApiCall) -> None:
     """Test that the ConversationModel object is initialized correctly."""
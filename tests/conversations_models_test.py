@@ -138,6 +138,7 @@ def test_create(fake_conversations_models: ConversationsModels) -> None:
 @pytest.mark.open_ai
 def test_actual_create(
     actual_conversations_models: ConversationsModels,
+    open_ai_env: None,
     create_conversation_history_collection: None,
 ) -> None:
     """Test that it can create an conversations_model on Typesense Server."""
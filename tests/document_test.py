@@ -35,6 +35,18 @@ def test_init(fake_api_call: ApiCall) -> None:
     )
 
 
+def test_reassigning_ids_rebuilds_endpoint_path(fake_api_call: ApiCall) -> None:
+    """Test that assigning the names updates the endpoint path built from them."""
+    document = Document(fake_api_call, "companies", "0")
+
+    document.document_id = "1"
+    document.collection_name = "people"
+
+    assert document.document_id == "1"
+    assert document.collection_name == "people"
+    assert document._endpoint_path == "/collections/people/documents/1"  # noqa: WPS437
+
+
 def test_retrieve(fake_document: Document) -> None:
     """Test that the Document object can retrieve an document."""
     json_response: Companies = {
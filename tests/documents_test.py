@@ -67,6 +67,31 @@ def test_get_existing_document(fake_documents: Documents) -> None:
     assert document is fetched_document
 
 
+def test_endpoint_path_is_built_once_per_action(fake_documents: Documents) -> None:
+    """Test that the Documents object reuses the endpoint path of each action."""
+    search_path = fake_documents._endpoint_path("search")  # noqa: WPS437
+
+    assert search_path == "/collections/companies/documents/search"
+    assert fake_documents._endpoint_path("search") is search_path  # noqa: WPS437
+    assert (
+        fake_documents._endpoint_path()  # noqa: WPS437
+        == "/collections/companies/documents/"
+    )
+
+
+def test_rename_drops_stale_endpoint_paths(fake_api_call: ApiCall) -> None:
+    """Test that assigning the collection name updates the endpoint paths."""
+    documents: Documents[Companies] = Documents(fake_api_call, "companies")
+    documents._endpoint_path("search")  # noqa: WPS437
+
+    documents.collection_name = "people"
+
+    assert (
+        documents._endpoint_path("search")  # noqa: WPS437
+        == "/collections/people/documents/search"
+    )
+
+
 def test_create(
     actual_documents: Documents[Companies],
     actual_api_call: ApiCall,
@@ -195,6 +220,19 @@ def test_export(
     assert response == '{"company_name":"Company","id":"0","num_employees":10}'
 
 
+def test_export_lines(
+    actual_documents: Documents[Companies],
+    delete_all: None,
+    create_collection: None,
+    create_document: None,
+) -> None:
+    """Test that the Documents object can stream an export from Typesense server."""
+    response = actual_documents.export_lines()
+    assert list(response) == [
+        '{"company_name":"Company","id":"0","num_employees":10}',
+    ]
+
+
 def test_delete(
     actual_documents: Documents[Companies],
     delete_all: None,
@@ -14,7 +14,7 @@ def fake_api_call_fixture(
     return ApiCall(fake_config)
 
 
-@pytest.fixture(scope="function", name="actual_api_call")
+@pytest.fixture(scope="session", name="actual_api_call")
 def actual_api_call_fixture(actual_config: Configuration) -> ApiCall:
     """Return an ApiCall object using a real API."""
     return ApiCall(actual_config)
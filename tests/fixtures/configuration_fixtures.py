@@ -40,7 +40,7 @@ def fake_config_dict_fixture() -> ConfigDict:
     }
 
 
-@pytest.fixture(scope="function", name="actual_config_dict")
+@pytest.fixture(scope="session", name="actual_config_dict")
 def actual_config_dict_fixture() -> ConfigDict:
     """Return a dictionary with test values."""
     return {
@@ -63,7 +63,7 @@ def fake_config_fixture(fake_config_dict: ConfigDict) -> Configuration:
     )
 
 
-@pytest.fixture(scope="function", name="actual_config")
+@pytest.fixture(scope="session", name="actual_config")
 def actual_config_fixture(actual_config_dict: ConfigDict) -> Configuration:
     """Return a Configuration object using a real API."""
     return Configuration(
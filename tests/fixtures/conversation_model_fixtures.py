@@ -4,13 +4,18 @@ import os
 
 import pytest
 import requests
-from dotenv import load_dotenv
 
 from typesense.api_call import ApiCall
 from typesense.conversation_model import ConversationModel
 from typesense.conversations_models import ConversationsModels
 
-load_dotenv()
+
+@pytest.fixture(scope="session", name="open_ai_env")
+def open_ai_env_fixture() -> None:
+    """Load the OpenAI credentials from the `.env` file."""
+    from dotenv import load_dotenv
+
+    load_dotenv()
 
 
 @pytest.fixture(scope="function", name="delete_all_conversations_models")
@@ -35,6 +40,7 @@ def clear_typesense_conversations_models() -> None:
 
 @pytest.fixture(scope="function", name="create_conversations_model")
 def create_conversations_model_fixture(
+    open_ai_env: None,
     create_conversation_history_collection: None,
 ) -> str:
     """Create a conversations model in the Typesense server."""
@@ -53,7 +53,7 @@ def actual_keys_fixture(actual_api_call: ApiCall) -> Keys:
 
 @pytest.fixture(scope="function", name="fake_keys")
 def fake_keys_fixture(fake_api_call: ApiCall) -> Keys:
-    """Return a AnalyticsRule object with test values."""
+    """Return a Keys object with test values."""
     return Keys(fake_api_call)
 
 
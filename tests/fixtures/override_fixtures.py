@@ -2,6 +2,7 @@
 
 import pytest
 import requests
+from requests_mock.mocker import Mocker
 
 from typesense.api_call import ApiCall
 from typesense.override import Override
@@ -30,7 +31,7 @@ def actual_overrides_fixture(actual_api_call: ApiCall) -> Overrides:
 
 @pytest.fixture(scope="function", name="fake_overrides")
 def fake_overrides_fixture(fake_api_call: ApiCall) -> Overrides:
-    """Return a Override object with test values."""
+    """Return an Overrides object with test values."""
     return Overrides(fake_api_call, "companies")
 
 
@@ -38,3 +39,27 @@ def fake_overrides_fixture(fake_api_call: ApiCall) -> Overrides:
 def fake_override_fixture(fake_api_call: ApiCall) -> Override:
     """Return a Override object with test values."""
     return Override(fake_api_call, "companies", "company_override")
+
+
+@pytest.fixture(scope="function", name="overrides_mock")
+def overrides_mock_fixture(requests_mock: Mocker) -> Mocker:
+    """Mock the override endpoints of the fake collection."""
+    requests_mock.get(
+        "http://nearest:8108/collections/companies/overrides/",
+        json={
+            "overrides": [
+                {
+                    "id": "company_override",
+                    "rule": {"match": "exact", "query": "companies"},
+                },
+            ],
+        },
+    )
+    requests_mock.put(
+        "http://nearest:8108/collections/companies/overrides/company_override",
+        json={
+            "id": "company_override",
+            "rule": {"match": "exact", "query": "companies"},
+        },
+    )
+    return requests_mock
@@ -32,17 +32,18 @@ def clear_typesense_stopwords() -> None:
     url = "http://localhost:8108/stopwords"
     headers = {"X-TYPESENSE-API-KEY": "xyz"}
 
-    # Get the list of stopwords
-    response = requests.get(url, headers=headers, timeout=3)
-    response.raise_for_status()
-    stopwords = response.json()
+    with requests.Session() as session:
+        # Get the list of stopwords
+        response = session.get(url, headers=headers, timeout=3)
+        response.raise_for_status()
+        stopwords = response.json()
 
-    # Delete each stopword
-    for stopword_set in stopwords["stopwords"]:
-        stopword_id = stopword_set.get("id")
-        delete_url = f"{url}/{stopword_id}"
-        delete_response = requests.delete(delete_url, headers=headers, timeout=3)
-        delete_response.raise_for_status()
+        # Delete each stopword over the session's kept-alive connection
+        for stopword_set in stopwords["stopwords"]:
+            stopword_id = stopword_set.get("id")
+            delete_url = f"{url}/{stopword_id}"
+            delete_response = session.delete(delete_url, headers=headers, timeout=3)
+            delete_response.raise_for_status()
 
 
 @pytest.fixture(scope="function", name="actual_stopwords")
@@ -65,5 +66,5 @@ def fake_stopwords_fixture(fake_api_call: ApiCall) -> Stopwords:
 
 @pytest.fixture(scope="function", name="fake_stopwords_set")
 def fake_stopwords_set_fixture(fake_api_call: ApiCall) -> StopwordsSet:
-    """Return a Collection object with test values."""
+    """Return a StopwordsSet object with test values."""
     return StopwordsSet(fake_api_call, "company_stopwords")
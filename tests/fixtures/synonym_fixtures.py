@@ -32,7 +32,7 @@ def fake_synonyms_fixture(fake_api_call: ApiCall) -> Synonyms:
     return Synonyms(fake_api_call, "companies")
 
 
-@pytest.fixture(scope="function", name="actual_synonyms")
+@pytest.fixture(scope="session", name="actual_synonyms")
 def actual_synonyms_fixture(actual_api_call: ApiCall) -> Synonyms:
     """Return a Synonyms object using a real API."""
     return Synonyms(actual_api_call, "companies")
@@ -1,14 +1,19 @@
 # mypy: disable-error-code="unreachable"
 """Test that the typing_extensions module is imported when Python version < 3.11."""
 
-import importlib
+import json
+import os
+import subprocess  # noqa: S404
 import sys
-from collections import namedtuple
 
 import pytest
-from pytest_mock import MockFixture
 
-typing_module_names = [
+if sys.version_info >= (3, 11):
+    import typing
+else:
+    import typing_extensions as typing
+
+typing_module_names = (
     "alias",
     "analytics_rule",
     "collection",
@@ -21,9 +26,9 @@ typing_module_names = [
     "override",
     "stopword",
     "synonym",
-]
+)
 
-module_names = [
+module_names = (
     "aliases",
     "analytics_rule",
     "analytics_rules",
@@ -43,64 +48,64 @@ module_names = [
     "synonyms",
     "preprocess",
     "stopwords",
-]
+)
+
+# Each check runs in a fresh interpreter: the modules must be imported with a faked
+# `sys.version_info`, and doing that in-process would mean swapping the typesense
+# modules in and out of `sys.modules` under the rest of the suite.
+IMPORT_CHECK = """
+import importlib
+import json
+import sys
+from collections import namedtuple
 
-# Create a namedtuple to mock sys.version_info
+# Import the dependencies under the real version; only typesense sees the fake one
+import requests
+import typing_extensions
+
+module_names, major, minor, expected_name = json.loads(sys.argv[1])
 VersionInfo = namedtuple(
     "VersionInfo",
     ["major", "minor", "micro", "releaselevel", "serial"],
 )
+sys.version_info = VersionInfo(major, minor, 0, "final", 0)
+
+expected_typing = importlib.import_module(expected_name)
+for module_name in module_names:
+    module = importlib.import_module(module_name)
+    assert module.typing is expected_typing, module_name
+"""
+
+
+def _check_typing_import(
+    version: typing.Tuple[int, int],
+    expected_typing: str,
+) -> None:
+    """Import every module under a faked Python version and check its typing module."""
+    qualified_names = [f"typesense.{name}" for name in module_names] + [
+        f"typesense.types.{name}" for name in typing_module_names
+    ]
+    subprocess.run(  # noqa: S603
+        [
+            sys.executable,
+            "-c",
+            IMPORT_CHECK,
+            json.dumps([qualified_names, *version, expected_typing]),
+        ],
+        check=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+    )
 
 
 @pytest.mark.skipif(
     sys.version_info < (3, 11),
-    reason="Test is only for Python < 3.11",
+    reason="Test is only for Python 3.11 or higher",
 )
-def test_import_typing(mocker: MockFixture) -> None:
+def test_import_typing() -> None:
     """Test that the typing module is imported when Python version is 3.11 or higher."""
-    mock_version_info = VersionInfo(3, 11, 0, "final", 0)
-    mocker.patch.object(sys, "version_info", mock_version_info)
+    _check_typing_import((3, 11), "typing")
 
-    # Import modules dynamically and assign them to a list
-    modules = [importlib.import_module(f"typesense.{name}") for name in module_names]
-    typing_modules = [
-        importlib.import_module(f"typesense.types.{name}")
-        for name in typing_module_names
-    ]
 
-    for module in modules:
-        assert "typing" in module.__dict__
-        assert module.typing == importlib.import_module("typing")
-
-    for module in typing_modules:
-        assert "typing" in module.__dict__
-        assert module.typing == importlib.import_module("typing")
-
-
-def test_import_typing_extensions(mocker: MockFixture) -> None:
+def test_import_typing_extensions() -> None:
     """Test that the typing_extensions module is imported when Python version < 3.11."""
-    mock_version_info = VersionInfo(3, 10, 0, "final", 0)
-    mocker.patch.object(sys, "version_info", mock_version_info)
-
-    # Import modules dynamically and assign them to a list
-    init_imports = [
-        importlib.import_module(f"typesense.{name}") for name in module_names
-    ]
-    modules = [importlib.reload(import_module) for import_module in init_imports]
-
-    init_typing_imports = [
-        importlib.import_module(f"typesense.types.{name}")
-        for name in typing_module_names
-    ]
-
-    typing_modules = [
-        importlib.reload(import_module) for import_module in init_typing_imports
-    ]
-
-    for module in modules:
-        assert "typing" in module.__dict__
-        assert module.typing == importlib.import_module("typing_extensions")
-
-    for module in typing_modules:
-        assert "typing" in module.__dict__
-        assert module.typing == importlib.import_module("typing_extensions")
+    _check_typing_import((3, 10), "typing_extensions")
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-import requests_mock
+from requests_mock.mocker import Mocker
 
 from tests.utils.object_assertions import (
     assert_match_object,
@@ -14,6 +14,14 @@ from typesense.key import Key
 from typesense.keys import Keys
 from typesense.types.key import ApiKeyDeleteSchema, ApiKeySchema
 
+KEY_RESPONSE: ApiKeySchema = {
+    "actions": ["documents:search"],
+    "collections": ["companies"],
+    "description": "Search-only key",
+}
+
+KEY_DELETE_RESPONSE: ApiKeyDeleteSchema = {"id": 1}
+
 
 def test_init(fake_api_call: ApiCall) -> None:
     """Test that the Key object is initialized correctly."""
@@ -32,43 +40,28 @@ def test_init(fake_api_call: ApiCall) -> None:
     assert key._endpoint_path == "/keys/3"  # noqa: WPS437
 
 
-def test_retrieve(fake_key: Key) -> None:
+def test_retrieve(fake_key: Key, requests_mock: Mocker) -> None:
     """Test that the Key object can retrieve an key."""
-    json_response: ApiKeySchema = {
-        "actions": ["documents:search"],
-        "collections": ["companies"],
-        "description": "Search-only key",
-    }
-
-    with requests_mock.Mocker() as mock:
-        mock.get(
-            "/keys/1",
-            json=json_response,
-        )
+    requests_mock.get("/keys/1", json=KEY_RESPONSE)
 
-        response = fake_key.retrieve()
+    response = fake_key.retrieve()
 
-        assert len(mock.request_history) == 1
-        assert mock.request_history[0].method == "GET"
-        assert mock.request_history[0].url == "http://nearest:8108/keys/1"
-        assert response == json_response
+    assert len(requests_mock.request_history) == 1
+    assert requests_mock.request_history[0].method == "GET"
+    assert requests_mock.request_history[0].url == "http://nearest:8108/keys/1"
+    assert response == KEY_RESPONSE
 
 
-def test_delete(fake_key: Key) -> None:
+def test_delete(fake_key: Key, requests_mock: Mocker) -> None:
     """Test that the Key object can delete an key."""
-    json_response: ApiKeyDeleteSchema = {"id": 1}
-    with requests_mock.Mocker() as mock:
-        mock.delete(
-            "/keys/1",
-            json=json_response,
-        )
-
-        response = fake_key.delete()
-
-        assert len(mock.request_history) == 1
-        assert mock.request_history[0].method == "DELETE"
-        assert mock.request_history[0].url == "http://nearest:8108/keys/1"
-        assert response == json_response
+    requests_mock.delete("/keys/1", json=KEY_DELETE_RESPONSE)
+
+    response = fake_key.delete()
+
+    assert len(requests_mock.request_history) == 1
+    assert requests_mock.request_history[0].method == "DELETE"
+    assert requests_mock.request_history[0].url == "http://nearest:8108/keys/1"
+    assert response == KEY_DELETE_RESPONSE
 
 
 def test_actual_retrieve(
@@ -3,12 +3,11 @@
 from __future__ import annotations
 
 import base64
-import hashlib
 import hmac
 import json
 import time
 
-import requests_mock
+from requests_mock.mocker import Mocker
 
 from tests.utils.object_assertions import (
     assert_match_object,
@@ -19,6 +18,19 @@ from typesense.api_call import ApiCall
 from typesense.keys import Keys
 from typesense.types.key import ApiKeyRetrieveSchema
 
+KEYS_RESPONSE: ApiKeyRetrieveSchema = {
+    "keys": [
+        {
+            "actions": ["documents:search"],
+            "collections": ["companies"],
+            "description": "Search-only key",
+            "expires_at": int(time.time()) + 3600,
+            "id": 1,
+            "value_prefix": "asdf",
+        },
+    ],
+}
+
 
 def test_init(fake_api_call: ApiCall) -> None:
     """Test that the Keys object is initialized correctly."""
@@ -62,70 +74,36 @@ def test_get_existing_key(fake_keys: Keys) -> None:
     assert key is fetched_key
 
 
-def test_retrieve(fake_keys: Keys) -> None:
+def test_retrieve(fake_keys: Keys, requests_mock: Mocker) -> None:
     """Test that the Keys object can retrieve keys."""
-    json_response: ApiKeyRetrieveSchema = {
-        "keys": [
-            {
-                "actions": ["documents:search"],
-                "collections": ["companies"],
-                "description": "Search-only key",
-                "expires_at": int(time.time()) + 3600,
-                "id": 1,
-                "value_prefix": "asdf",
-            },
-        ],
-    }
+    requests_mock.get("http://nearest:8108/keys", json=KEYS_RESPONSE)
 
-    with requests_mock.Mocker() as mock:
-        mock.get(
-            "http://nearest:8108/keys",
-            json=json_response,
-        )
+    response = fake_keys.retrieve()
 
-        response = fake_keys.retrieve()
+    assert len(response) == 1
+    assert response["keys"][0] == KEYS_RESPONSE["keys"][0]
+    assert response == KEYS_RESPONSE
 
-        assert len(response) == 1
-        assert response["keys"][0] == json_response.get("keys")[0]
-        assert response == json_response
 
-
-def test_create(fake_keys: Keys) -> None:
+def test_create(fake_keys: Keys, requests_mock: Mocker) -> None:
     """Test that the Keys object can create a key."""
-    json_response: ApiKeyRetrieveSchema = {
-        "keys": [
-            {
-                "actions": ["documents:search"],
-                "collections": ["companies"],
-                "description": "Search-only key",
-                "expires_at": int(time.time()) + 3600,
-                "id": 1,
-                "value_prefix": "asdf",
-            },
-        ],
-    }
+    requests_mock.post("http://nearest:8108/keys", json=KEYS_RESPONSE)
 
-    with requests_mock.Mocker() as mock:
-        mock.post(
-            "http://nearest:8108/keys",
-            json=json_response,
-        )
-
-        fake_keys.create(
-            schema={
-                "actions": ["documents:search"],
-                "collections": ["companies"],
-            },
-        )
-
-        assert mock.call_count == 1
-        assert mock.called is True
-        assert mock.last_request.method == "POST"
-        assert mock.last_request.url == "http://nearest:8108/keys"
-        assert mock.last_request.json() == {
+    fake_keys.create(
+        schema={
             "actions": ["documents:search"],
             "collections": ["companies"],
-        }
+        },
+    )
+
+    assert requests_mock.call_count == 1
+    assert requests_mock.called is True
+    assert requests_mock.last_request.method == "POST"
+    assert requests_mock.last_request.url == "http://nearest:8108/keys"
+    assert requests_mock.last_request.json() == {
+        "actions": ["documents:search"],
+        "collections": ["companies"],
+    }
 
 
 def test_actual_create(
@@ -186,24 +164,11 @@ def test_generate_scoped_search_key(
 
     key = fake_keys.generate_scoped_search_key(search_key, search_parameters)
 
-    decoded_key = base64.b64decode(key).decode("utf-8")
+    decoded_key = base64.b64decode(key)
+    params_bytes = json.dumps(search_parameters).encode("utf-8")
 
-    extracted_key = {
-        "digest": decoded_key[:44],
-        "key_prefix": decoded_key[44:48],
-        "params_str": decoded_key[48:],
-    }
-    assert extracted_key["key_prefix"] == search_key[:4]
-
-    expected_params_str = json.dumps(search_parameters)
-    assert extracted_key["params_str"] == expected_params_str
-
-    recomputed_digest = base64.b64encode(
-        hmac.new(
-            search_key.encode("utf-8"),
-            expected_params_str.encode("utf-8"),
-            digestmod=hashlib.sha256,
-        ).digest(),
-    ).decode("utf-8")
-
-    assert extracted_key["digest"] == recomputed_digest
+    assert decoded_key[44:48] == search_key[:4].encode("utf-8")
+    assert decoded_key[48:] == params_bytes
+    assert decoded_key[:44] == base64.b64encode(
+        hmac.digest(search_key.encode("utf-8"), params_bytes, "sha256"),
+    )
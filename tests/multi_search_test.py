@@ -13,6 +13,23 @@ from typesense.api_call import ApiCall
 from typesense.multi_search import MultiSearch
 from typesense.types.multi_search import MultiSearchRequestSchema
 
+RESULT_KEYS = frozenset(
+    (
+        "facet_counts",
+        "found",
+        "hits",
+        "page",
+        "out_of",
+        "request_params",
+        "search_time_ms",
+        "search_cutoff",
+    ),
+)
+
+HIT_KEYS = frozenset(
+    ("document", "highlights", "highlight", "text_match", "text_match_info"),
+)
+
 
 def test_init(fake_api_call: ApiCall) -> None:
     """Test that the Document object is initialized correctly."""
@@ -47,24 +64,9 @@ def test_multi_search_single_search(
     )
 
     assert len(response.get("results")) == 1
-    assert_to_contain_keys(
-        response.get("results")[0],
-        [
-            "facet_counts",
-            "found",
-            "hits",
-            "page",
-            "out_of",
-            "request_params",
-            "search_time_ms",
-            "search_cutoff",
-        ],
-    )
+    assert_to_contain_keys(response.get("results")[0], RESULT_KEYS)
 
-    assert_to_contain_keys(
-        response.get("results")[0].get("hits")[0],
-        ["document", "highlights", "highlight", "text_match", "text_match_info"],
-    )
+    assert_to_contain_keys(response.get("results")[0].get("hits")[0], HIT_KEYS)
 
 
 def test_multi_search_multiple_searches(
@@ -86,24 +88,9 @@ def test_multi_search_multiple_searches(
 
     assert len(response.get("results")) == len(request_params.get("searches"))
     for search_results in response.get("results"):
-        assert_to_contain_keys(
-            search_results,
-            [
-                "facet_counts",
-                "found",
-                "hits",
-                "page",
-                "out_of",
-                "request_params",
-                "search_time_ms",
-                "search_cutoff",
-            ],
-        )
+        assert_to_contain_keys(search_results, RESULT_KEYS)
 
-        assert_to_contain_keys(
-            search_results.get("hits")[0],
-            ["document", "highlights", "highlight", "text_match", "text_match_info"],
-        )
+        assert_to_contain_keys(search_results.get("hits")[0], HIT_KEYS)
 
 
 def test_multi_search_array(
@@ -122,24 +109,9 @@ def test_multi_search_array(
     response = actual_multi_search.perform(search_queries=request_params)
 
     assert len(response.get("results")) == 1
-    assert_to_contain_keys(
-        response.get("results")[0],
-        [
-            "facet_counts",
-            "found",
-            "hits",
-            "page",
-            "out_of",
-            "request_params",
-            "search_time_ms",
-            "search_cutoff",
-        ],
-    )
+    assert_to_contain_keys(response.get("results")[0], RESULT_KEYS)
 
-    assert_to_contain_keys(
-        response.get("results")[0].get("hits")[0],
-        ["document", "highlights", "highlight", "text_match", "text_match_info"],
-    )
+    assert_to_contain_keys(response.get("results")[0].get("hits")[0], HIT_KEYS)
 
 
 def test_search_invalid_parameters(
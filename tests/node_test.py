@@ -13,7 +13,7 @@ def test_node_initialization() -> None:
     """Test the initialization of the Node class using an object."""
     node = Node(host="localhost", port=8108, path="/path", protocol="http")
 
-    current_time = int(time.time())
+    current_time = int(time.monotonic())
     expected = {
         "host": "localhost",
         "port": 8108,
@@ -29,7 +29,7 @@ def test_node_from_url() -> None:
     """Test the initialization of the Node class using a URL."""
     node = Node.from_url("http://localhost:8108/path")
 
-    current_time = int(time.time())
+    current_time = int(time.monotonic())
     expected = {
         "host": "localhost",
         "port": 8108,
@@ -4,8 +4,8 @@ from __future__ import annotations
 
 import pytest
 import requests_mock
+from pytest_mock import MockFixture
 
-from tests.utils.object_assertions import assert_match_object, assert_object_lists_match
 from typesense.api_call import ApiCall
 from typesense.exceptions import ObjectNotFound
 from typesense.operations import Operations
@@ -15,15 +15,7 @@ def test_init(fake_api_call: ApiCall) -> None:
     """Test that the Override object is initialized correctly."""
     operations = Operations(fake_api_call)
 
-    assert_match_object(operations.api_call, fake_api_call)
-    assert_object_lists_match(
-        operations.api_call.node_manager.nodes,
-        fake_api_call.node_manager.nodes,
-    )
-    assert_match_object(
-        operations.api_call.config.nearest_node,
-        fake_api_call.config.nearest_node,
-    )
+    assert operations.api_call is fake_api_call
     assert (
         operations._endpoint_path("resource") == "/operations/resource"  # noqa: WPS437
     )
@@ -80,6 +72,18 @@ def test_health_not_dict(fake_operations: Operations) -> None:
         assert not response
 
 
+def test_health_not_dict_skips_lookup(
+    fake_operations: Operations,
+    mocker: MockFixture,
+) -> None:
+    """Test that a non-dict health response is rejected without reading from it."""
+    health_response = mocker.Mock()
+    mocker.patch.object(ApiCall, "get", return_value=health_response)
+
+    assert not fake_operations.is_healthy()
+    health_response.get.assert_not_called()
+
+
 def test_log_slow_requests_time_ms(actual_operations: Operations) -> None:
     """Test that the Operations object can perform the log_slow_requests_time_ms operation."""
     response = actual_operations.toggle_slow_request_log(
@@ -2,17 +2,42 @@
 
 from __future__ import annotations
 
-import requests_mock
+import sys
 
-from tests.utils.object_assertions import (
-    assert_match_object,
-    assert_object_lists_match,
-    assert_to_contain_object,
-)
-from typesense.api_call import ApiCall
-from typesense.collections import Collections
-from typesense.override import Override, OverrideDeleteSchema
-from typesense.types.override import OverrideSchema
+if sys.version_info >= (3, 11):
+    import typing
+else:
+    import typing_extensions as typing
+
+from tests.utils.object_assertions import assert_to_contain_object
+from typesense.override import Override
+
+if typing.TYPE_CHECKING:
+    from requests_mock.mocker import Mocker
+
+    from typesense.api_call import ApiCall
+    from typesense.collections import Collections
+    from typesense.override import OverrideDeleteSchema
+    from typesense.types.override import OverrideSchema
+
+OVERRIDE_PATH = "/collections/companies/overrides/company_override"
+OVERRIDE_URL = f"http://nearest:8108{OVERRIDE_PATH}"
+
+OVERRIDE_RESPONSE: OverrideSchema = {
+    "rule": {
+        "match": "contains",
+        "query": "companies",
+    },
+    "filter_by": "num_employees>10",
+}
+OVERRIDE_DELETE_RESPONSE: OverrideDeleteSchema = {"id": "company_override"}
+COMPANY_OVERRIDE: OverrideSchema = {
+    "rule": {
+        "match": "exact",
+        "query": "companies",
+    },
+    "filter_by": "num_employees>10",
+}
 
 
 def test_init(fake_api_call: ApiCall) -> None:
@@ -21,68 +46,32 @@ def test_init(fake_api_call: ApiCall) -> None:
 
     assert override.collection_name == "companies"
     assert override.override_id == "company_override"
-    assert_match_object(override.api_call, fake_api_call)
-    assert_object_lists_match(
-        override.api_call.node_manager.nodes,
-        fake_api_call.node_manager.nodes,
-    )
-    assert_match_object(
-        override.api_call.config.nearest_node,
-        fake_api_call.config.nearest_node,
-    )
-    assert (
-        override._endpoint_path()  # noqa: WPS437
-        == "/collections/companies/overrides/company_override"
-    )
-
-
-def test_retrieve(fake_override: Override) -> None:
+    assert override.api_call is fake_api_call
+    assert override._endpoint_path() == OVERRIDE_PATH  # noqa: WPS437
+
+
+def test_retrieve(fake_override: Override, requests_mock: Mocker) -> None:
     """Test that the Override object can retrieve an override."""
-    json_response: OverrideSchema = {
-        "rule": {
-            "match": "contains",
-            "query": "companies",
-        },
-        "filter_by": "num_employees>10",
-    }
-
-    with requests_mock.Mocker() as mock:
-        mock.get(
-            "/collections/companies/overrides/company_override",
-            json=json_response,
-        )
-
-        response = fake_override.retrieve()
-
-        assert len(mock.request_history) == 1
-        assert mock.request_history[0].method == "GET"
-        assert (
-            mock.request_history[0].url
-            == "http://nearest:8108/collections/companies/overrides/company_override"
-        )
-        assert response == json_response
-
-
-def test_delete(fake_override: Override) -> None:
+    requests_mock.get(OVERRIDE_PATH, json=OVERRIDE_RESPONSE)
+
+    response = fake_override.retrieve()
+
+    assert [
+        (request.method, request.url) for request in requests_mock.request_history
+    ] == [("GET", OVERRIDE_URL)]
+    assert response == OVERRIDE_RESPONSE
+
+
+def test_delete(fake_override: Override, requests_mock: Mocker) -> None:
     """Test that the Override object can delete an override."""
-    json_response: OverrideDeleteSchema = {
-        "id": "company_override",
-    }
-    with requests_mock.Mocker() as mock:
-        mock.delete(
-            "/collections/companies/overrides/company_override",
-            json=json_response,
-        )
-
-        response = fake_override.delete()
-
-        assert len(mock.request_history) == 1
-        assert mock.request_history[0].method == "DELETE"
-        assert (
-            mock.request_history[0].url
-            == "http://nearest:8108/collections/companies/overrides/company_override"
-        )
-        assert response == {"id": "company_override"}
+    requests_mock.delete(OVERRIDE_PATH, json=OVERRIDE_DELETE_RESPONSE)
+
+    response = fake_override.delete()
+
+    assert [
+        (request.method, request.url) for request in requests_mock.request_history
+    ] == [("DELETE", OVERRIDE_URL)]
+    assert response == OVERRIDE_DELETE_RESPONSE
 
 
 def test_actual_retrieve(
@@ -93,21 +82,7 @@ def test_actual_retrieve(
     """Test that the Override object can retrieve an override from Typesense Server."""
     response = actual_collections["companies"].overrides["company_override"].retrieve()
 
-    assert response["rule"] == {
-        "match": "exact",
-        "query": "companies",
-    }
-    assert response["filter_by"] == "num_employees>10"
-    assert_to_contain_object(
-        response,
-        {
-            "rule": {
-                "match": "exact",
-                "query": "companies",
-            },
-            "filter_by": "num_employees>10",
-        },
-    )
+    assert_to_contain_object(response, COMPANY_OVERRIDE)
 
 
 def test_actual_delete(
@@ -118,4 +93,4 @@ def test_actual_delete(
     """Test that the Override object can delete an override from Typesense Server."""
     response = actual_collections["companies"].overrides["company_override"].delete()
 
-    assert response == {"id": "company_override"}
+    assert response == OVERRIDE_DELETE_RESPONSE
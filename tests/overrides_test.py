@@ -2,31 +2,31 @@
 
 from __future__ import annotations
 
-import requests_mock
+import sys
 
-from tests.utils.object_assertions import (
-    assert_match_object,
-    assert_object_lists_match,
-    assert_to_contain_object,
-)
-from typesense.api_call import ApiCall
-from typesense.collections import Collections
-from typesense.overrides import OverrideRetrieveSchema, Overrides, OverrideSchema
+if sys.version_info >= (3, 11):
+    import typing
+else:
+    import typing_extensions as typing
+
+from tests.utils.object_assertions import assert_to_contain_object
+from typesense.overrides import Overrides
+
+if typing.TYPE_CHECKING:
+    from requests_mock.mocker import Mocker
+
+    from typesense.api_call import ApiCall
+    from typesense.collections import Collections
+
+OVERRIDE_PATH = "/collections/companies/overrides/company_override"
+OVERRIDE_URL = f"http://nearest:8108{OVERRIDE_PATH}"
 
 
 def test_init(fake_api_call: ApiCall) -> None:
     """Test that the Overrides object is initialized correctly."""
     overrides = Overrides(fake_api_call, "companies")
 
-    assert_match_object(overrides.api_call, fake_api_call)
-    assert_object_lists_match(
-        overrides.api_call.node_manager.nodes,
-        fake_api_call.node_manager.nodes,
-    )
-    assert_match_object(
-        overrides.api_call.config.nearest_node,
-        fake_api_call.config.nearest_node,
-    )
+    assert overrides.api_call is fake_api_call
 
     assert not overrides.overrides
 
@@ -36,19 +36,9 @@ def test_get_missing_override(fake_overrides: Overrides) -> None:
     override = fake_overrides["company_override"]
 
     assert override.override_id == "company_override"
-    assert_match_object(override.api_call, fake_overrides.api_call)
-    assert_object_lists_match(
-        override.api_call.node_manager.nodes, fake_overrides.api_call.node_manager.nodes
-    )
-    assert_match_object(
-        override.api_call.config.nearest_node,
-        fake_overrides.api_call.config.nearest_node,
-    )
+    assert override.api_call is fake_overrides.api_call
     assert override.collection_name == "companies"
-    assert (
-        override._endpoint_path()  # noqa: WPS437
-        == "/collections/companies/overrides/company_override"
-    )
+    assert override._endpoint_path() == OVERRIDE_PATH  # noqa: WPS437
 
 
 def test_get_existing_override(fake_overrides: Overrides) -> None:
@@ -61,9 +51,12 @@ def test_get_existing_override(fake_overrides: Overrides) -> None:
     assert override is fetched_override
 
 
-def test_retrieve(fake_overrides: Overrides) -> None:
+def test_retrieve(fake_overrides: Overrides, overrides_mock: Mocker) -> None:
     """Test that the Overrides object can retrieve overrides."""
-    json_response: OverrideRetrieveSchema = {
+    response = fake_overrides.retrieve()
+
+    assert overrides_mock.call_count == 1
+    assert response == {
         "overrides": [
             {
                 "id": "company_override",
@@ -71,79 +64,33 @@ def test_retrieve(fake_overrides: Overrides) -> None:
             },
         ],
     }
-    with requests_mock.Mocker() as mock:
-        mock.get(
-            "http://nearest:8108/collections/companies/overrides/",
-            json=json_response,
-        )
-
-        response = fake_overrides.retrieve()
-
-    assert len(response) == 1
-    assert response["overrides"][0] == {
-        "id": "company_override",
-        "rule": {"match": "exact", "query": "companies"},
-    }
-    assert response == json_response
 
 
-def test_create(fake_overrides: Overrides) -> None:
+def test_create(fake_overrides: Overrides, overrides_mock: Mocker) -> None:
     """Test that the Overrides object can create a override."""
-    json_response: OverrideSchema = {
-        "id": "company_override",
-        "rule": {"match": "exact", "query": "companies"},
-    }
-
-    with requests_mock.Mocker() as mock:
-        mock.put(
-            "http://nearest:8108/collections/companies/overrides/company_override",
-            json=json_response,
-        )
-
-        fake_overrides.upsert(
-            "company_override",
-            {"rule": {"match": "exact", "query": "companies"}},
-        )
-
-        assert mock.call_count == 1
-        assert mock.called is True
-        assert mock.last_request.method == "PUT"
-        assert (
-            mock.last_request.url
-            == "http://nearest:8108/collections/companies/overrides/company_override"
-        )
-        assert mock.last_request.json() == {
-            "rule": {"match": "exact", "query": "companies"},
-        }
-
-
-def test_actual_create(
-    actual_overrides: Overrides,
-    delete_all: None,
-    create_collection: None,
-) -> None:
-    """Test that the Overrides object can create an override on Typesense Server."""
-    response = actual_overrides.upsert(
+    fake_overrides.upsert(
         "company_override",
-        {
-            "rule": {"match": "exact", "query": "companies"},
-            "filter_by": "num_employees>10",
-        },
+        {"rule": {"match": "exact", "query": "companies"}},
     )
 
-    assert response == {
-        "id": "company_override",
-        "rule": {"match": "exact", "query": "companies"},
-        "filter_by": "num_employees>10",
-    }
+    assert [
+        (request.method, request.url, request.json())
+        for request in overrides_mock.request_history
+    ] == [
+        (
+            "PUT",
+            OVERRIDE_URL,
+            {"rule": {"match": "exact", "query": "companies"}},
+        ),
+    ]
 
 
-def test_actual_update(
+def test_actual_upsert(
     actual_overrides: Overrides,
     delete_all: None,
     create_collection: None,
 ) -> None:
-    """Test that the Overrides object can update an override on Typesense Server."""
+    """Test that the Overrides object can create, then update, an override."""
     create_response = actual_overrides.upsert(
         "company_override",
         {
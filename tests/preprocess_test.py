@@ -1,7 +1,14 @@
 """Tests for the preprocess module."""
 
+import sys
+
 import pytest
 
+if sys.version_info >= (3, 11):
+    import typing
+else:
+    import typing_extensions as typing
+
 from typesense import exceptions
 from typesense.preprocess import (
     ParamSchema,
@@ -11,46 +18,42 @@ from typesense.preprocess import (
 )
 
 
-def test_stringify_str() -> None:
-    """Test that the function can stringify a string."""
-    assert stringify("string") == "string"
-
-
-def test_stringify_bool() -> None:
-    """Test that the function can stringify a boolean."""
-    assert stringify(True) == "true"
-
-
-def test_stringify_int() -> None:
-    """Test that the function can stringify an integer."""
-    assert stringify(42) == "42"
-
-
-def test_stringify_float() -> None:
-    """Test that the function can stringify a float."""
-    with pytest.raises(exceptions.InvalidParameter):
-        stringify(3.15)
+@pytest.mark.parametrize(
+    ("param_value", "expected"),
+    [("string", "string"), (True, "true"), (False, "false"), (42, "42")],
+    ids=["str", "true", "false", "int"],
+)
+def test_stringify(param_value: typing.Union[str, bool, int], expected: str) -> None:
+    """Test that the function can stringify strings, booleans and integers."""
+    assert stringify(param_value) == expected
 
 
-def test_stringify_list() -> None:
-    """Test that the function can stringify a list."""
+@pytest.mark.parametrize(
+    "param_value",
+    [3.15, [1, 2, 3]],
+    ids=["float", "list"],
+)
+def test_stringify_invalid(param_value: typing.Any) -> None:
+    """Test that the function rejects floats and lists."""
     with pytest.raises(exceptions.InvalidParameter):
-        stringify([1, 2, 3])
-
+        stringify(param_value)
 
-def test_concat_string_list() -> None:
-    """Test that the function can concatenate a list of strings."""
-    assert process_param_list(["a", "b", "c"]) == "a,b,c"
 
-
-def test_concat_bool_list() -> None:
-    """Test that the function can concatenate a list of booleans."""
-    assert process_param_list([True, False, True]) == "true,false,true"
-
-
-def test_concat_int_list() -> None:
-    """Test that the function can concatenate a list of integers."""
-    assert process_param_list([1, 2, 3]) == "1,2,3"
+@pytest.mark.parametrize(
+    ("param_list", "expected"),
+    [
+        (["a", "b", "c"], "a,b,c"),
+        ([True, False, True], "true,false,true"),
+        ([1, 2, 3], "1,2,3"),
+    ],
+    ids=["string_list", "bool_list", "int_list"],
+)
+def test_concat_list(
+    param_list: typing.List[typing.Union[str, bool, int]],
+    expected: str,
+) -> None:
+    """Test that the function can concatenate a list of strings, booleans or integers."""
+    assert process_param_list(param_list) == expected
 
 
 def test_concat_list_list() -> None:
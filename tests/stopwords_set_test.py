@@ -2,13 +2,24 @@
 
 from __future__ import annotations
 
-import requests_mock
+import sys
+
+if sys.version_info >= (3, 11):
+    import typing
+else:
+    import typing_extensions as typing
 
-from tests.utils.object_assertions import assert_match_object, assert_object_lists_match
-from typesense.api_call import ApiCall
-from typesense.stopwords import Stopwords
 from typesense.stopwords_set import StopwordsSet
-from typesense.types.stopword import StopwordDeleteSchema, StopwordSchema
+
+if typing.TYPE_CHECKING:
+    from requests_mock.mocker import Mocker
+
+    from typesense.api_call import ApiCall
+    from typesense.stopwords import Stopwords
+    from typesense.types.stopword import StopwordDeleteSchema, StopwordSchema
+
+STOPWORDS_SET_PATH = "/stopwords/company_stopwords"
+STOPWORDS_SET_URL = f"http://nearest:8108{STOPWORDS_SET_PATH}"
 
 
 def test_init(fake_api_call: ApiCall) -> None:
@@ -16,62 +27,39 @@ def test_init(fake_api_call: ApiCall) -> None:
     stopword_set = StopwordsSet(fake_api_call, "company_stopwords")
 
     assert stopword_set.stopwords_set_id == "company_stopwords"
-    assert_match_object(stopword_set.api_call, fake_api_call)
-    assert_object_lists_match(
-        stopword_set.api_call.node_manager.nodes,
-        fake_api_call.node_manager.nodes,
-    )
-    assert_match_object(
-        stopword_set.api_call.config.nearest_node,
-        fake_api_call.config.nearest_node,
-    )
-    assert stopword_set._endpoint_path == "/stopwords/company_stopwords"  # noqa: WPS437
-
-
-def test_retrieve(fake_stopwords_set: StopwordsSet) -> None:
+    assert stopword_set.api_call is fake_api_call
+    assert stopword_set._endpoint_path == STOPWORDS_SET_PATH  # noqa: WPS437
+
+
+def test_retrieve(fake_stopwords_set: StopwordsSet, requests_mock: Mocker) -> None:
     """Test that the StopwordsSet object can retrieve an stopword_set."""
     json_response: StopwordSchema = {
         "id": "company_stopwords",
         "stopwords": ["a", "an", "the"],
     }
+    requests_mock.get(STOPWORDS_SET_URL, json=json_response)
 
-    with requests_mock.Mocker() as mock:
-        mock.get(
-            "/stopwords/company_stopwords",
-            json=json_response,
-        )
-
-        response = fake_stopwords_set.retrieve()
+    response = fake_stopwords_set.retrieve()
 
-        assert len(mock.request_history) == 1
-        assert mock.request_history[0].method == "GET"
-        assert (
-            mock.request_history[0].url
-            == "http://nearest:8108/stopwords/company_stopwords"
-        )
-        assert response == json_response
+    assert [
+        (request.method, request.url) for request in requests_mock.request_history
+    ] == [("GET", STOPWORDS_SET_URL)]
+    assert response == json_response
 
 
-def test_delete(fake_stopwords_set: StopwordsSet) -> None:
+def test_delete(fake_stopwords_set: StopwordsSet, requests_mock: Mocker) -> None:
     """Test that the StopwordsSet object can delete an stopword_set."""
     json_response: StopwordDeleteSchema = {
         "id": "company_stopwords",
     }
-    with requests_mock.Mocker() as mock:
-        mock.delete(
-            "/stopwords/company_stopwords",
-            json=json_response,
-        )
-
-        response = fake_stopwords_set.delete()
-
-        assert len(mock.request_history) == 1
-        assert mock.request_history[0].method == "DELETE"
-        assert (
-            mock.request_history[0].url
-            == "http://nearest:8108/stopwords/company_stopwords"
-        )
-        assert response == json_response
+    requests_mock.delete(STOPWORDS_SET_URL, json=json_response)
+
+    response = fake_stopwords_set.delete()
+
+    assert [
+        (request.method, request.url) for request in requests_mock.request_history
+    ] == [("DELETE", STOPWORDS_SET_URL)]
+    assert response == json_response
 
 
 def test_actual_retrieve(
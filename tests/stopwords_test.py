@@ -2,31 +2,45 @@
 
 from __future__ import annotations
 
-import requests_mock
-
-from tests.utils.object_assertions import (
-    assert_match_object,
-    assert_object_lists_match,
-    assert_to_contain_object,
-)
-from typesense.api_call import ApiCall
+import sys
+
+if sys.version_info >= (3, 11):
+    import typing
+else:
+    import typing_extensions as typing
+
+from tests.utils.object_assertions import assert_to_contain_object
 from typesense.stopwords import Stopwords
-from typesense.types.stopword import StopwordSchema, StopwordsRetrieveSchema
+
+if typing.TYPE_CHECKING:
+    from requests_mock.mocker import Mocker
+
+    from typesense.api_call import ApiCall
+    from typesense.types.stopword import (
+        StopwordCreateSchema,
+        StopwordSchema,
+        StopwordsRetrieveSchema,
+    )
+
+STOPWORDS_PATH = "/stopwords"
+STOPWORDS_URL = f"http://nearest:8108{STOPWORDS_PATH}"
+STOPWORDS_SET_PATH = f"{STOPWORDS_PATH}/company_stopwords"
+STOPWORDS_SET_URL = f"http://nearest:8108{STOPWORDS_SET_PATH}"
+
+COMPANY_STOPWORDS_BODY: StopwordCreateSchema = {"stopwords": ["and", "is", "the"]}
+COMPANY_STOPWORDS: StopwordSchema = {
+    "id": "company_stopwords",
+    "locale": "",
+    "stopwords": ["and", "is", "the"],
+}
+STOPWORDS_RESPONSE: StopwordsRetrieveSchema = {"stopwords": [COMPANY_STOPWORDS]}
 
 
 def test_init(fake_api_call: ApiCall) -> None:
     """Test that the Stopwords object is initialized correctly."""
     stopwords = Stopwords(fake_api_call)
 
-    assert_match_object(stopwords.api_call, fake_api_call)
-    assert_object_lists_match(
-        stopwords.api_call.node_manager.nodes,
-        fake_api_call.node_manager.nodes,
-    )
-    assert_match_object(
-        stopwords.api_call.config.nearest_node,
-        fake_api_call.config.nearest_node,
-    )
+    assert stopwords.api_call is fake_api_call
 
     assert not stopwords.stopwords_sets
 
@@ -36,15 +50,8 @@ def test_get_missing_stopword(fake_stopwords: Stopwords) -> None:
     stopword = fake_stopwords["company_stopwords"]
 
     assert stopword.stopwords_set_id == "company_stopwords"
-    assert_match_object(stopword.api_call, fake_stopwords.api_call)
-    assert_object_lists_match(
-        stopword.api_call.node_manager.nodes, fake_stopwords.api_call.node_manager.nodes
-    )
-    assert_match_object(
-        stopword.api_call.config.nearest_node,
-        fake_stopwords.api_call.config.nearest_node,
-    )
-    assert stopword._endpoint_path == "/stopwords/company_stopwords"  # noqa: WPS437
+    assert stopword.api_call is fake_stopwords.api_call
+    assert stopword._endpoint_path == STOPWORDS_SET_PATH  # noqa: WPS437
 
 
 def test_get_existing_stopword(fake_stopwords: Stopwords) -> None:
@@ -57,86 +64,42 @@ def test_get_existing_stopword(fake_stopwords: Stopwords) -> None:
     assert stopword is fetched_stopword
 
 
-def test_retrieve(fake_stopwords: Stopwords) -> None:
+def test_retrieve(fake_stopwords: Stopwords, requests_mock: Mocker) -> None:
     """Test that the Stopwords object can retrieve stopwords."""
-    json_response: StopwordsRetrieveSchema = {
-        "stopwords": [
-            {
-                "id": "company_stopwords",
-                "locale": "",
-                "stopwords": ["and", "is", "the"],
-            },
-        ],
-    }
-
-    with requests_mock.Mocker() as mock:
-        mock.get(
-            "http://nearest:8108/stopwords",
-            json=json_response,
-        )
+    requests_mock.get(STOPWORDS_URL, json=STOPWORDS_RESPONSE)
 
-        response = fake_stopwords.retrieve()
+    response = fake_stopwords.retrieve()
 
-        assert len(response) == 1
-        assert response["stopwords"][0] == json_response["stopwords"][0]
-        assert response == json_response
+    assert [
+        (request.method, request.url) for request in requests_mock.request_history
+    ] == [("GET", STOPWORDS_URL)]
+    assert response == STOPWORDS_RESPONSE
 
 
-def test_create(fake_stopwords: Stopwords) -> None:
+def test_create(fake_stopwords: Stopwords, requests_mock: Mocker) -> None:
     """Test that the Stopwords object can create a stopword."""
-    json_response: StopwordSchema = {
-        "id": "company_stopwords",
-        "locale": "",
-        "stopwords": ["and", "is", "the"],
-    }
+    requests_mock.put(STOPWORDS_SET_URL, json=COMPANY_STOPWORDS)
 
-    with requests_mock.Mocker() as mock:
-        mock.put(
-            "http://nearest:8108/stopwords/company_stopwords",
-            json=json_response,
-        )
-
-        fake_stopwords.upsert(
-            "company_stopwords",
-            {"stopwords": ["and", "is", "the"]},
-        )
-
-        assert mock.call_count == 1
-        assert mock.called is True
-        assert mock.last_request.method == "PUT"
-        assert (
-            mock.last_request.url == "http://nearest:8108/stopwords/company_stopwords"
-        )
-        assert mock.last_request.json() == {"stopwords": ["and", "is", "the"]}
-
-
-def test_actual_create(actual_stopwords: Stopwords, delete_all_stopwords: None) -> None:
-    """Test that the Stopwords object can create an stopword on Typesense Server."""
-    response = actual_stopwords.upsert(
-        "company_stopwords",
-        {"stopwords": ["and", "is", "the"]},
-    )
+    response = fake_stopwords.upsert("company_stopwords", COMPANY_STOPWORDS_BODY)
 
-    assert response == {
-        "id": "company_stopwords",
-        "stopwords": ["and", "is", "the"],
-    }
+    assert [
+        (request.method, request.url, request.json())
+        for request in requests_mock.request_history
+    ] == [("PUT", STOPWORDS_SET_URL, COMPANY_STOPWORDS_BODY)]
+    assert response == COMPANY_STOPWORDS
 
 
-def test_actual_update(
+def test_actual_upsert(
     actual_stopwords: Stopwords,
     delete_all_stopwords: None,
 ) -> None:
-    """Test that the Stopwords object can update an stopword on Typesense Server."""
+    """Test that the Stopwords object can create, then update, a stopword set."""
     create_response = actual_stopwords.upsert(
         "company_stopwords",
-        {"stopwords": ["and", "is", "the"]},
+        COMPANY_STOPWORDS_BODY,
     )
 
-    assert create_response == {
-        "id": "company_stopwords",
-        "stopwords": ["and", "is", "the"],
-    }
+    assert create_response == {"id": "company_stopwords", **COMPANY_STOPWORDS_BODY}
 
     update_response = actual_stopwords.upsert(
         "company_stopwords",
@@ -160,8 +123,5 @@ def test_actual_retrieve(
     assert len(response["stopwords"]) == 1
     assert_to_contain_object(
         response["stopwords"][0],
-        {
-            "id": "company_stopwords",
-            "stopwords": ["and", "is", "the"],
-        },
+        {"id": "company_stopwords", **COMPANY_STOPWORDS_BODY},
     )
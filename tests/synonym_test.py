@@ -2,17 +2,33 @@
 
 from __future__ import annotations
 
-import requests_mock
+import sys
 
-from tests.utils.object_assertions import (
-    assert_match_object,
-    assert_object_lists_match,
-    assert_to_contain_object,
-)
-from typesense.api_call import ApiCall
-from typesense.collections import Collections
-from typesense.synonym import Synonym, SynonymDeleteSchema
-from typesense.synonyms import SynonymSchema
+if sys.version_info >= (3, 11):
+    import typing
+else:
+    import typing_extensions as typing
+
+from tests.utils.object_assertions import assert_to_contain_object
+from typesense.synonym import Synonym
+
+if typing.TYPE_CHECKING:
+    from requests_mock.mocker import Mocker
+
+    from typesense.api_call import ApiCall
+    from typesense.collections import Collections
+    from typesense.synonym import SynonymDeleteSchema
+    from typesense.synonyms import SynonymSchema
+
+SYNONYM_PATH = "/collections/companies/synonyms/company_synonym"
+SYNONYM_URL = f"http://nearest:8108{SYNONYM_PATH}"
+
+COMPANY_SYNONYMS = ["companies", "corporations", "firms"]
+SYNONYM_RESPONSE: SynonymSchema = {
+    "id": "company_synonym",
+    "synonyms": COMPANY_SYNONYMS,
+}
+SYNONYM_DELETE_RESPONSE: SynonymDeleteSchema = {"id": "company_synonym"}
 
 
 def test_init(fake_api_call: ApiCall) -> None:
@@ -21,65 +37,32 @@ def test_init(fake_api_call: ApiCall) -> None:
 
     assert synonym.collection_name == "companies"
     assert synonym.synonym_id == "company_synonym"
-    assert_match_object(synonym.api_call, fake_api_call)
-    assert_object_lists_match(
-        synonym.api_call.node_manager.nodes,
-        fake_api_call.node_manager.nodes,
-    )
-    assert_match_object(
-        synonym.api_call.config.nearest_node,
-        fake_api_call.config.nearest_node,
-    )
-    assert (
-        synonym._endpoint_path()  # noqa: WPS437
-        == "/collections/companies/synonyms/company_synonym"
-    )
-
-
-def test_retrieve(fake_synonym: Synonym) -> None:
-    """Test that the Synonym object can retrieve an synonym."""
-    json_response: SynonymSchema = {
-        "id": "company_synonym",
-        "synonyms": ["companies", "corporations", "firms"],
-    }
+    assert synonym.api_call is fake_api_call
+    assert synonym._endpoint_path() == SYNONYM_PATH  # noqa: WPS437
+
 
-    with requests_mock.Mocker() as mock:
-        mock.get(
-            "/collections/companies/synonyms/company_synonym",
-            json=json_response,
-        )
+def test_retrieve(fake_synonym: Synonym, requests_mock: Mocker) -> None:
+    """Test that the Synonym object can retrieve an synonym."""
+    requests_mock.get(SYNONYM_PATH, json=SYNONYM_RESPONSE)
 
-        response = fake_synonym.retrieve()
+    response = fake_synonym.retrieve()
 
-        assert len(mock.request_history) == 1
-        assert mock.request_history[0].method == "GET"
-        assert (
-            mock.request_history[0].url
-            == "http://nearest:8108/collections/companies/synonyms/company_synonym"
-        )
-        assert response == json_response
+    assert [
+        (request.method, request.url) for request in requests_mock.request_history
+    ] == [("GET", SYNONYM_URL)]
+    assert response == SYNONYM_RESPONSE
 
 
-def test_delete(fake_synonym: Synonym) -> None:
+def test_delete(fake_synonym: Synonym, requests_mock: Mocker) -> None:
     """Test that the Synonym object can delete an synonym."""
-    json_response: SynonymDeleteSchema = {
-        "id": "company_synonym",
-    }
-    with requests_mock.Mocker() as mock:
-        mock.delete(
-            "/collections/companies/synonyms/company_synonym",
-            json=json_response,
-        )
-
-        response = fake_synonym.delete()
-
-        assert len(mock.request_history) == 1
-        assert mock.request_history[0].method == "DELETE"
-        assert (
-            mock.request_history[0].url
-            == "http://nearest:8108/collections/companies/synonyms/company_synonym"
-        )
-        assert response == {"id": "company_synonym"}
+    requests_mock.delete(SYNONYM_PATH, json=SYNONYM_DELETE_RESPONSE)
+
+    response = fake_synonym.delete()
+
+    assert [
+        (request.method, request.url) for request in requests_mock.request_history
+    ] == [("DELETE", SYNONYM_URL)]
+    assert response == SYNONYM_DELETE_RESPONSE
 
 
 def test_actual_retrieve(
@@ -92,14 +75,8 @@ def test_actual_retrieve(
 
     assert response["id"] == "company_synonym"
 
-    assert response["synonyms"] == ["companies", "corporations", "firms"]
-    assert_to_contain_object(
-        response,
-        {
-            "id": "company_synonym",
-            "synonyms": ["companies", "corporations", "firms"],
-        },
-    )
+    assert response["synonyms"] == COMPANY_SYNONYMS
+    assert_to_contain_object(response, SYNONYM_RESPONSE)
 
 
 def test_actual_delete(
@@ -110,4 +87,4 @@ def test_actual_delete(
     """Test that the Synonym object can delete an synonym from Typesense Server."""
     response = actual_collections["companies"].synonyms["company_synonym"].delete()
 
-    assert response == {"id": "company_synonym"}
+    assert response == SYNONYM_DELETE_RESPONSE
@@ -2,31 +2,51 @@
 
 from __future__ import annotations
 
-import requests_mock
+import sys
+
+if sys.version_info >= (3, 11):
+    import typing
+else:
+    import typing_extensions as typing
 
 from tests.utils.object_assertions import (
     assert_match_object,
     assert_object_lists_match,
     assert_to_contain_object,
 )
-from typesense.api_call import ApiCall
-from typesense.collections import Collections
-from typesense.synonyms import Synonyms, SynonymSchema, SynonymsRetrieveSchema
+from typesense.synonyms import Synonyms
+
+if typing.TYPE_CHECKING:
+    from requests_mock.mocker import Mocker
+
+    from typesense.api_call import ApiCall
+    from typesense.collections import Collections
+    from typesense.synonyms import (
+        SynonymCreateSchema,
+        SynonymSchema,
+        SynonymsRetrieveSchema,
+    )
+
+SYNONYMS_PATH = "/collections/companies/synonyms/"
+SYNONYMS_URL = f"http://nearest:8108{SYNONYMS_PATH}"
+SYNONYM_PATH = "/collections/companies/synonyms/company_synonym"
+SYNONYM_URL = f"http://nearest:8108{SYNONYM_PATH}"
+
+COMPANY_SYNONYMS = ["companies", "corporations", "firms"]
+COMPANY_SYNONYM: SynonymCreateSchema = {"synonyms": COMPANY_SYNONYMS}
+SYNONYM_RESPONSE: SynonymSchema = {
+    "id": "company_synonym",
+    "synonyms": COMPANY_SYNONYMS,
+}
 
 
 def test_init(fake_api_call: ApiCall) -> None:
     """Test that the Synonyms object is initialized correctly."""
     synonyms = Synonyms(fake_api_call, "companies")
 
-    assert_match_object(synonyms.api_call, fake_api_call)
-    assert_object_lists_match(
-        synonyms.api_call.node_manager.nodes,
-        fake_api_call.node_manager.nodes,
-    )
-    assert_match_object(
-        synonyms.api_call.config.nearest_node,
-        fake_api_call.config.nearest_node,
-    )
+    assert synonyms.collection_name == "companies"
+    assert synonyms.api_call is fake_api_call
+    assert synonyms._endpoint_path() == SYNONYMS_PATH  # noqa: WPS437
 
     assert not synonyms.synonyms
 
@@ -45,10 +65,7 @@ def test_get_missing_synonym(fake_synonyms: Synonyms) -> None:
         fake_synonyms.api_call.config.nearest_node,
     )
     assert synonym.collection_name == "companies"
-    assert (
-        synonym._endpoint_path()  # noqa: WPS437
-        == "/collections/companies/synonyms/company_synonym"
-    )
+    assert synonym._endpoint_path() == SYNONYM_PATH  # noqa: WPS437
 
 
 def test_get_existing_synonym(fake_synonyms: Synonyms) -> None:
@@ -61,61 +78,29 @@ def test_get_existing_synonym(fake_synonyms: Synonyms) -> None:
     assert synonym is fetched_synonym
 
 
-def test_retrieve(fake_synonyms: Synonyms) -> None:
+def test_retrieve(fake_synonyms: Synonyms, requests_mock: Mocker) -> None:
     """Test that the Synonyms object can retrieve synonyms."""
-    json_response: SynonymsRetrieveSchema = {
-        "synonyms": [
-            {
-                "id": "company_synonym",
-                "synonyms": ["companies", "corporations", "firms"],
-            },
-        ],
-    }
+    json_response: SynonymsRetrieveSchema = {"synonyms": [SYNONYM_RESPONSE]}
 
-    with requests_mock.Mocker() as mock:
-        mock.get(
-            "http://nearest:8108/collections/companies/synonyms/",
-            json=json_response,
-        )
+    requests_mock.get(SYNONYMS_URL, json=json_response)
 
-        response = fake_synonyms.retrieve()
+    response = fake_synonyms.retrieve()
 
-        assert len(response) == 1
-        assert response["synonyms"][0] == {
-            "id": "company_synonym",
-            "synonyms": ["companies", "corporations", "firms"],
-        }
-        assert response == json_response
+    assert len(response) == 1
+    assert response["synonyms"][0] == SYNONYM_RESPONSE
+    assert response == json_response
 
 
-def test_create(fake_synonyms: Synonyms) -> None:
+def test_create(fake_synonyms: Synonyms, requests_mock: Mocker) -> None:
     """Test that the Synonyms object can create a synonym."""
-    json_response: SynonymSchema = {
-        "id": "company_synonym",
-        "synonyms": ["companies", "corporations", "firms"],
-    }
+    requests_mock.put(SYNONYM_URL, json=SYNONYM_RESPONSE)
+
+    fake_synonyms.upsert("company_synonym", COMPANY_SYNONYM)
 
-    with requests_mock.Mocker() as mock:
-        mock.put(
-            "http://nearest:8108/collections/companies/synonyms/company_synonym",
-            json=json_response,
-        )
-
-        fake_synonyms.upsert(
-            "company_synonym",
-            {"synonyms": ["companies", "corporations", "firms"]},
-        )
-
-        assert mock.call_count == 1
-        assert mock.called is True
-        assert mock.last_request.method == "PUT"
-        assert (
-            mock.last_request.url
-            == "http://nearest:8108/collections/companies/synonyms/company_synonym"
-        )
-        assert mock.last_request.json() == {
-            "synonyms": ["companies", "corporations", "firms"],
-        }
+    assert [
+        (request.method, request.url, request.json())
+        for request in requests_mock.request_history
+    ] == [("PUT", SYNONYM_URL, COMPANY_SYNONYM)]
 
 
 def test_actual_create(
@@ -124,15 +109,9 @@ def test_actual_create(
     create_collection: None,
 ) -> None:
     """Test that the Synonyms object can create an synonym on Typesense Server."""
-    response = actual_synonyms.upsert(
-        "company_synonym",
-        {"synonyms": ["companies", "corporations", "firms"]},
-    )
+    response = actual_synonyms.upsert("company_synonym", COMPANY_SYNONYM)
 
-    assert response == {
-        "id": "company_synonym",
-        "synonyms": ["companies", "corporations", "firms"],
-    }
+    assert response == SYNONYM_RESPONSE
 
 
 def test_actual_update(
@@ -141,15 +120,9 @@ def test_actual_update(
     create_collection: None,
 ) -> None:
     """Test that the Synonyms object can update an synonym on Typesense Server."""
-    create_response = actual_synonyms.upsert(
-        "company_synonym",
-        {"synonyms": ["companies", "corporations", "firms"]},
-    )
+    create_response = actual_synonyms.upsert("company_synonym", COMPANY_SYNONYM)
 
-    assert create_response == {
-        "id": "company_synonym",
-        "synonyms": ["companies", "corporations", "firms"],
-    }
+    assert create_response == SYNONYM_RESPONSE
 
     update_response = actual_synonyms.upsert(
         "company_synonym",
@@ -171,10 +144,4 @@ def test_actual_retrieve(
     response = actual_collections["companies"].synonyms.retrieve()
 
     assert len(response["synonyms"]) == 1
-    assert_to_contain_object(
-        response["synonyms"][0],
-        {
-            "id": "company_synonym",
-            "synonyms": ["companies", "corporations", "firms"],
-        },
-    )
+    assert_to_contain_object(response["synonyms"][0], SYNONYM_RESPONSE)
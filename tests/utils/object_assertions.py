@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import difflib
 import sys
 
 if sys.version_info >= (3, 11):
@@ -20,7 +19,8 @@ def obj_to_dict(
     """
     Convert an object to a dictionary.
 
-    If the object is already a dictionary, return it as is.
+    If the object is already a dictionary, return it as is. Slotted attributes are
+    included alongside the instance dictionary, if the object has one.
 
     Args:
         input_obj: The object to convert.
@@ -28,7 +28,14 @@ def obj_to_dict(
     Returns:
         The object as a dictionary.
     """
-    return input_obj if isinstance(input_obj, typing.Dict) else input_obj.__dict__
+    if input_obj.__class__ is dict or isinstance(input_obj, dict):
+        return input_obj
+    slots = getattr(input_obj.__class__, "__slots__", ())
+    if not slots:
+        return vars(input_obj)
+    attrs = {slot: getattr(input_obj, slot) for slot in slots}
+    attrs.update(getattr(input_obj, "__dict__", {}))
+    return attrs
 
 
 def assert_match_object(
@@ -46,23 +53,26 @@ def assert_match_object(
         AssertionError: If the objects do not have the same attribute values.
     """
     actual_attrs = obj_to_dict(actual)
-
     expected_attrs = obj_to_dict(expected)
 
-    for key, _ in actual_attrs.items():
-        assert key in expected_attrs, f"Attribute {key} not found in expected object"
+    if actual_attrs == expected_attrs:
+        return
+
+    missing_keys = actual_attrs.keys() - expected_attrs.keys()
+    assert not missing_keys, f"Attributes {missing_keys} not found in expected object"
 
-        if actual_attrs[key] != expected_attrs[key]:
-            raise_with_diff([{key: expected_attrs[key]}], [{key: actual_attrs[key]}])
+    expected_subset = {key: expected_attrs[key] for key in actual_attrs}
+    if actual_attrs != expected_subset:
+        raise_with_diff([expected_subset], [actual_attrs])
 
 
 def assert_to_contain_keys(
     actual: typing.Dict[str, typing.Any],
-    keys: typing.List[str],
+    keys: typing.Iterable[str],
 ) -> None:
     """Assert that the actual dictionary contains the expected keys."""
-    for key in keys:
-        assert key in actual, f"Key {key} not found in actual dictionary"
+    missing_keys = frozenset(keys).difference(actual)
+    assert not missing_keys, f"Keys {missing_keys} not found in actual dictionary"
 
 
 def assert_to_contain_object(
@@ -71,14 +81,14 @@ def assert_to_contain_object(
 ) -> None:
     """Assert that two objects have the same attribute values."""
     actual_attrs = obj_to_dict(actual)
-
     expected_attrs = obj_to_dict(expected)
 
-    for key, _ in expected_attrs.items():
-        assert key in actual_attrs, f"Attribute {key} not found in expected object"
+    missing_keys = expected_attrs.keys() - actual_attrs.keys()
+    assert not missing_keys, f"Attributes {missing_keys} not found in actual object"
 
-        if actual_attrs[key] != expected_attrs[key]:
-            raise_with_diff([{key: expected_attrs[key]}], [{key: actual_attrs[key]}])
+    actual_subset = {key: actual_attrs[key] for key in expected_attrs}
+    if actual_subset != expected_attrs:
+        raise_with_diff([expected_attrs], [actual_subset])
 
 
 def assert_object_lists_match(
@@ -89,34 +99,66 @@ def assert_object_lists_match(
     actual_dicts = [obj_to_dict(actual_obj) for actual_obj in actual]
     expected_dicts = [obj_to_dict(expected_obj) for expected_obj in expected]
 
-    actual_counter = typing.Counter(
-        tuple(sorted(dict_entry.items())) for dict_entry in actual_dicts
-    )
-    expected_counter = typing.Counter(
-        tuple(sorted(dict_entry.items())) for dict_entry in expected_dicts
-    )
-    if actual_counter != expected_counter:
-        raise_with_diff(expected_dicts, actual_dicts)
+    if actual_dicts == expected_dicts:
+        return
+
+    # Same elements in a different order still match, so fall back to comparing
+    # the lists as multisets; with at most one element there is no other order.
+    actual_entries = [tuple(sorted(entry.items())) for entry in actual_dicts]
+    expected_entries = [tuple(sorted(entry.items())) for entry in expected_dicts]
+    if len(actual_entries) > 1:
+        actual_counter = typing.Counter(actual_entries)
+        if actual_counter == typing.Counter(expected_entries):
+            return
+
+    raise_with_entries_diff(expected_entries, actual_entries)
 
 
 def raise_with_diff(
-    expected_dicts: typing.Sequence[dict[str, typing.Any]],
-    actual_dicts: typing.Sequence[dict[str, typing.Any]],
+    expected_dicts: typing.Sequence[typing.Dict[str, typing.Any]],
+    actual_dicts: typing.Sequence[typing.Dict[str, typing.Any]],
 ) -> None:
     """
-    Raise an AssertionError with a unified diff of the expected and actual values.
+    Raise an AssertionError showing the expected and actual values.
+
+    A single dictionary on each side is shown as is; longer lists get a unified diff.
 
     Args:
-        expected: The expected value.
-        actual: The actual value.
+        expected_dicts: The expected values.
+        actual_dicts: The actual values.
     """
-    expected_str = [str(sorted(dict_entry.items())) for dict_entry in expected_dicts]
-    actual_str = [str(sorted(dict_entry.items())) for dict_entry in actual_dicts]
+    if len(expected_dicts) == 1 == len(actual_dicts):
+        raise AssertionError(
+            "Objects do not match:\n"
+            f"expected {expected_dicts[0]!r}\n"
+            f"actual   {actual_dicts[0]!r}",
+        )
+
+    raise_with_entries_diff(
+        [tuple(sorted(dict_entry.items())) for dict_entry in expected_dicts],
+        [tuple(sorted(dict_entry.items())) for dict_entry in actual_dicts],
+    )
+
+
+def raise_with_entries_diff(
+    expected_entries: typing.Sequence[typing.Tuple[typing.Tuple[str, typing.Any], ...]],
+    actual_entries: typing.Sequence[typing.Tuple[typing.Tuple[str, typing.Any], ...]],
+) -> None:
+    """
+    Raise an AssertionError with a unified diff of already sorted dictionary items.
+
+    Args:
+        expected_entries: The expected values, as sorted `(key, value)` tuples.
+        actual_entries: The actual values, as sorted `(key, value)` tuples.
+    """
+    import difflib  # Only needed once an assertion has already failed.
+
     diff = difflib.unified_diff(
-        expected_str,
-        actual_str,
+        [str(list(entry)) for entry in expected_entries],
+        [str(list(entry)) for entry in actual_entries],
         fromfile="expected",
         tofile="actual",
+        n=1,
         lineterm="",
     )
     diff_output = "\n".join(diff)